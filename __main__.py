@@ -17,6 +17,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_URL_PREFIXES = ('http://', 'https://')
+
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -98,7 +100,7 @@ def main():
                 print("No URL provided. Using default: https://example.com")
                 url = "https://example.com"
                 
-            if not url.startswith(('http://', 'https://')):
+            if not url.startswith(_URL_PREFIXES):
                 url = 'https://' + url
                 
             print(f"\nLaunching Chrome browser to load: {url}")
@@ -132,11 +134,9 @@ def main():
                     print(f"URL: {browser.get_current_url()}")
                     
                     print("\nBrowser will close automatically in 30 seconds...")
-                    print("Press Ctrl+C to close immediately")
+                    print("Close the window or press Ctrl+C to close immediately")
                     
-                    start_time = time.time()
-                    while time.time() - start_time < 30:
-                        time.sleep(0.5)
+                    browser.wait_for_window_close(30)
                         
                 except KeyboardInterrupt:
                     print("\nInterrupted by user.")
@@ -192,7 +192,6 @@ def main():
                         print("Logging in...")
                         if site.login(username, password):
                             print("Login successful!")
-                            site.save_cookies()  # Save cookies for future sessions
                         else:
                             print("Login failed!")
                             return 1
@@ -210,11 +209,9 @@ def main():
                     
                     # Keep the browser open for a while
                     print("\nBrowser will close automatically in 30 seconds...")
-                    print("Press Ctrl+C to close immediately")
+                    print("Close the window or press Ctrl+C to close immediately")
                     
-                    start_time = time.time()
-                    while time.time() - start_time < 30:
-                        time.sleep(0.5)
+                    site.browser.wait_for_window_close(30)
                         
                 except KeyboardInterrupt:
                     print("\nInterrupted by user.")
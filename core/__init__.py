@@ -33,13 +33,6 @@ def _import_config():
         DEFAULT_DRIVER_CONFIG = DDC
     return ChromeConfig, DEFAULT_CONFIG
 
-# Set default logging configuration
-import logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-
 __all__ = [
     'ChromeDriver',
     'ChromeConfig',
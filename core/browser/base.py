@@ -19,6 +19,10 @@ from .exceptions import (
 # Type variable for generic typing
 T = TypeVar('T')
 
+# Poll interval shared by the explicit wait helpers. Selenium's 0.5s default
+# adds ~250ms of average overshoot to every wait that succeeds.
+DEFAULT_POLL_FREQUENCY = 0.1
+
 class BaseBrowser(ABC):
     """Abstract base class defining the browser interface."""
     
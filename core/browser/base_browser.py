@@ -1,5 +1,6 @@
 """Base browser implementation with common functionality."""
 import logging
+import time
 from typing import Any, Optional, Type, TypeVar, Callable
 from functools import wraps
 
@@ -95,11 +96,9 @@ class BaseBrowser(IBrowser):
         
         try:
             self._logger.info(f"Navigating to: {url}")
-            self._driver.get(url)
-            
             if wait_time is not None:
-                time.sleep(wait_time)
-                
+                self._driver.set_page_load_timeout(wait_time)
+            self._driver.get(url)
             return True
             
         except Exception as e:
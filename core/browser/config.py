@@ -75,11 +75,21 @@ class ChromeConfig(BrowserConfig):
     
     def __post_init__(self):
         """Post-initialization setup."""
-        if self.headless and '--headless' not in ' '.join(self.chrome_args):
-            self.chrome_args.append('--headless=new')
+        # Switch names (the part before '=') already present, kept in step with
+        # chrome_args so each duplicate check is a set lookup
+        present = {arg.split('=', 1)[0] for arg in self.chrome_args}
         
-        if self.window_size and not any('--window-size=' in arg for arg in self.chrome_args):
-            self.chrome_args.append(f'--window-size={self.window_size[0]},{self.window_size[1]}')
+        def add_arg(arg: str) -> None:
+            name = arg.split('=', 1)[0]
+            if name not in present:
+                present.add(name)
+                self.chrome_args.append(arg)
+        
+        if self.headless:
+            add_arg('--headless=new')
+        
+        if self.window_size:
+            add_arg(f'--window-size={self.window_size[0]},{self.window_size[1]}')
         
         # Add common Chrome options for stability
         common_args = [
@@ -130,13 +140,11 @@ class ChromeConfig(BrowserConfig):
             
             # Add profile arguments to chrome_args if not already present
             for arg in profile_args:
-                if arg.split('=')[0] not in [a.split('=')[0] for a in self.chrome_args]:
-                    self.chrome_args.append(arg)
+                add_arg(arg)
         
         # Add all common arguments to chrome_args if not already present
         for arg in common_args:
-            if arg.split('=')[0] not in [a.split('=')[0] for a in self.chrome_args]:
-                self.chrome_args.append(arg)
+            add_arg(arg)
 
 
 # Default configuration
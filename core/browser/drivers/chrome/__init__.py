@@ -3,24 +3,132 @@
 This package provides the Chrome browser driver implementation for the browser automation
 framework. It uses Selenium WebDriver under the hood to control a Chrome browser instance.
 """
-from typing import Optional, Type, TypeVar
+import atexit
+import json
+import logging
+import os
+import threading
+import weakref
+from typing import Dict, List, Optional, Type, TypeVar
+
+from selenium.common.exceptions import WebDriverException
 
 from .browser import ChromeBrowser
 from .config import ChromeConfig
 
 # Re-export the ChromeBrowser class
-__all__ = ['ChromeBrowser', 'ChromeConfig', 'create_driver']
+__all__ = ['ChromeBrowser', 'ChromeConfig', 'create_driver', 'release_driver']
 
 # Type variable for type hints
 T = TypeVar('T', bound='ChromeBrowser')
 
+logger = logging.getLogger(__name__)
+
+# Opt-in reuse of started browsers between create_driver/release_driver calls
+REUSE_DRIVER = os.environ.get("CHROME_PUPPET_REUSE_DRIVER", "0") == "1"
+
+# Idle started browsers, keyed by their serialized configuration
+_driver_pool: Dict[str, List[ChromeBrowser]] = {}
+_pool_lock = threading.Lock()
+# Pool key of each browser handed out, so release does not re-serialize
+# its configuration
+_pool_keys: 'weakref.WeakKeyDictionary[ChromeBrowser, str]' = weakref.WeakKeyDictionary()
+
+# Clears per-origin state so the next user of a pooled browser starts clean
+_RESET_STORAGE_SCRIPT = "try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}"
+
+
+def _pool_key(config: Optional[ChromeConfig]) -> str:
+    """Build the pool key for a configuration."""
+    return json.dumps(config.to_dict() if config else {}, sort_keys=True, default=str)
+
+
+def _stop_quietly(browser: ChromeBrowser) -> None:
+    """Stop a browser on release or eviction, logging rather than raising."""
+    try:
+        browser.stop()
+    except Exception as e:
+        logger.debug(f"Error stopping browser: {e}")
+
+
+def _drain_pool() -> None:
+    """Stop every idle pooled browser; registered to run at interpreter exit."""
+    with _pool_lock:
+        idle = [browser for browsers in _driver_pool.values() for browser in browsers]
+        _driver_pool.clear()
+    for browser in idle:
+        _stop_quietly(browser)
+
+
+atexit.register(_drain_pool)
+
+
 def create_driver(config: Optional[ChromeConfig] = None) -> ChromeBrowser:
     """Create a new Chrome browser instance.
-    
+
+    When ``CHROME_PUPPET_REUSE_DRIVER=1`` is set, an idle browser released
+    with the same configuration is handed out instead, already started, so
+    the caller skips Chrome and chromedriver start-up. Calling ``start()`` on
+    it is a no-op.
+
     Args:
         config: Optional configuration for the Chrome browser.
-        
+
     Returns:
-        A new ChromeBrowser instance.
+        A ChromeBrowser instance.
     """
+    if REUSE_DRIVER:
+        key = _pool_key(config)
+        while True:
+            with _pool_lock:
+                idle = _driver_pool.get(key)
+                browser = idle.pop() if idle else None
+            if browser is None:
+                break
+            try:
+                # Cheap health check; the session may have died while idle
+                browser.driver.current_url
+                return browser
+            except WebDriverException as e:
+                logger.debug(f"Discarding dead pooled browser: {e}")
+                _stop_quietly(browser)
+        
+        browser = ChromeBrowser(config=config)
+        with _pool_lock:
+            _pool_keys[browser] = key
+        return browser
+
     return ChromeBrowser(config=config)
+
+
+def release_driver(browser: ChromeBrowser) -> None:
+    """Return a browser obtained from :func:`create_driver`.
+
+    With reuse enabled, cookies and web storage are cleared and the browser
+    is kept for the next :func:`create_driver` call with the same
+    configuration; idle browsers still pooled at exit are stopped then.
+    Otherwise the browser is stopped.
+
+    Args:
+        browser: The browser to release.
+    """
+    if not REUSE_DRIVER or not browser.is_running():
+        _stop_quietly(browser)
+        return
+
+    try:
+        browser.driver.delete_all_cookies()
+        browser.driver.execute_script(_RESET_STORAGE_SCRIPT)
+        browser.driver.get("about:blank")
+    except WebDriverException as e:
+        logger.debug(f"Could not reset browser for reuse, stopping it: {e}")
+        _stop_quietly(browser)
+        return
+
+    with _pool_lock:
+        key = _pool_keys.get(browser)
+    if key is None:
+        key = _pool_key(getattr(browser, '_config', None))
+    with _pool_lock:
+        _pool_keys[browser] = key
+        _driver_pool.setdefault(key, []).append(browser)
@@ -3,9 +3,12 @@ from __future__ import annotations
 
 import logging
 import os
+import re
 import time
+import uuid
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, Type, TypeVar, Generic, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Set, Tuple, Union, Type, TypeVar, Generic, TYPE_CHECKING
+from urllib.parse import urldefrag, urljoin
 
 from selenium import webdriver
 from selenium.common.exceptions import (
@@ -20,8 +23,10 @@ from selenium.webdriver.chrome.webdriver import WebDriver as ChromeWebDriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.remote.shadowroot import ShadowRoot
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 
-from core.browser.base import BaseBrowser
+from core.browser.base import BaseBrowser, DEFAULT_POLL_FREQUENCY
 from core.config.base import BrowserConfig
 from core.browser.exceptions import (
     BrowserError,
@@ -44,6 +49,80 @@ from core.browser.drivers.chrome.config import ChromeConfig
 from core.browser.drivers.chrome.options import ChromeOptionsBuilder
 from core.browser.drivers.chrome.service import ChromeServiceFactory
 
+# Resource types that rarely matter for automation but delay the load event.
+# Script hosts (e.g. reCAPTCHA) are deliberately not included.
+DEFAULT_BLOCKED_URL_PATTERNS = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*hotjar.com*",
+    "*.woff",
+    "*.woff2",
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+]
+
+# Starts a navigation without waiting for the load event and returns the
+# starting URL. The token marks the current document, so the caller can tell
+# it apart from the new one
+_START_NAVIGATION_SCRIPT = """
+window.__puppetDocument = arguments[1];
+var start = window.location.href;
+window.location.href = arguments[0];
+return start;
+"""
+
+# null while the document marked with the token is still in place, otherwise
+# true once the document is parsed and, if given, the selector matches
+_DOM_READY_SCRIPT = """
+if (arguments[1] && window.__puppetDocument === arguments[1]) { return null; }
+if (document.readyState === 'loading') { return false; }
+return !arguments[0] || document.querySelector(arguments[0]) !== null;
+"""
+
+# Case-insensitive search of the page markup done in the browser, so only a
+# boolean crosses the wire instead of the whole serialized DOM
+_PAGE_CONTAINS_SCRIPT = (
+    "return document.documentElement.outerHTML.toLowerCase()"
+    ".indexOf(arguments[0].toLowerCase()) !== -1;"
+)
+
+# Applies a style to an element and returns the one it replaces, so the
+# highlight costs a single round trip
+_SWAP_STYLE_SCRIPT = (
+    "var old = arguments[0].getAttribute('style') || '';"
+    "arguments[0].setAttribute('style', arguments[1]);"
+    "return old;"
+)
+
+# Border drawn around an element captured with highlight=True
+ELEMENT_HIGHLIGHT_STYLE = "border: 2px solid red;"
+
+# Writes a whole mapping into localStorage in one round trip, optionally
+# clearing it first
+_SET_LOCAL_STORAGE_SCRIPT = (
+    "var items = arguments[0];"
+    "if (arguments[1]) { localStorage.clear(); }"
+    "for (var key in items) { localStorage.setItem(key, items[key]); }"
+)
+
+# WebDriver cookie keys and their CDP Network.CookieParam equivalents
+_CDP_COOKIE_FIELDS = (
+    ('path', 'path'),
+    ('secure', 'secure'),
+    ('httpOnly', 'httpOnly'),
+    ('expiry', 'expires'),
+    ('sameSite', 'sameSite'),
+)
+
+
+def _is_same_document(current_url: str, url: str) -> bool:
+    """Whether navigating from ``current_url`` to ``url`` only moves the fragment."""
+    target, fragment = urldefrag(urljoin(current_url, url))
+    return bool(fragment) and target == urldefrag(current_url)[0]
+
+
 # Logger will be set in __init__
 
 class ChromeBrowser(BaseBrowser):
@@ -73,6 +152,10 @@ class ChromeBrowser(BaseBrowser):
         self._options: Optional[ChromeOptions] = None
         self._is_running: bool = False
         self._config = config  # Store the config for later use
+        # URL patterns currently blocked in this session
+        self._blocked_urls: Optional[Tuple[str, ...]] = None
+        # Directories screenshots have already been saved into
+        self._screenshot_dirs: Set[str] = set()
     
     def navigate_to(self, url: str, wait_time: Optional[float] = None) -> bool:
         """Navigate to the specified URL.
@@ -148,14 +231,16 @@ class ChromeBrowser(BaseBrowser):
             self._logger.info("Starting Chrome browser")
             try:
                 # Log the options being used
-                self._logger.debug(f"Chrome options: {self._options.arguments}")
+                self._logger.debug("Chrome options: %s", self._options.arguments)
                 if hasattr(self._service, 'service_url'):
-                    self._logger.debug(f"Chrome service URL: {self._service.service_url}")
+                    self._logger.debug("Chrome service URL: %s", self._service.service_url)
                 
-                # Create the WebDriver instance
+                # Create the WebDriver instance; keep-alive reuses one
+                # connection to chromedriver instead of a handshake per command
                 self._driver = ChromeWebDriver(
                     service=self._service,
-                    options=self._options
+                    options=self._options,
+                    keep_alive=True
                 )
                 
                 # Mark as running after successful driver creation
@@ -165,11 +250,25 @@ class ChromeBrowser(BaseBrowser):
                 # Set window size if specified
                 if hasattr(self._config, 'window_size') and self._config.window_size:
                     try:
-                        self._logger.debug(f"Setting window size to: {self._config.window_size}")
+                        self._logger.debug("Setting window size to: %s", self._config.window_size)
                         self.set_window_size(*self._config.window_size)
                     except Exception as e:
                         self._logger.warning(f"Could not set window size: {e}")
                 
+                pool_size = getattr(self._config, 'connection_pool_size', None)
+                if pool_size:
+                    try:
+                        self._set_connection_pool_size(pool_size)
+                    except Exception as e:
+                        self._logger.warning(f"Could not resize connection pool: {e}")
+                
+                blocked_urls = getattr(self._config, 'blocked_url_patterns', None)
+                if blocked_urls:
+                    try:
+                        self.block_urls(blocked_urls)
+                    except Exception as e:
+                        self._logger.warning(f"Could not block URL patterns: {e}")
+                
                 self._logger.info("Chrome browser started successfully")
                 return self
                 
@@ -194,6 +293,10 @@ class ChromeBrowser(BaseBrowser):
                 
                 raise BrowserError(error_msg) from e
             
+        except BrowserError:
+            # Already logged and cleaned up by the step that failed
+            raise
+            
         except WebDriverException as e:
             error_msg = f"WebDriver error while starting Chrome: {e}"
             self._logger.error(error_msg, exc_info=True)
@@ -228,6 +331,7 @@ class ChromeBrowser(BaseBrowser):
                     self._logger.error(f"Unexpected error while quitting WebDriver: {e}", exc_info=True)
                 finally:
                     self._driver = None
+                    self._blocked_urls = None
             
             # Stop the Chrome service
             if self._service is not None:
@@ -268,7 +372,7 @@ class ChromeBrowser(BaseBrowser):
                 self._driver.set_page_load_timeout(timeout)
                 
             self._driver.get(url)
-            self._logger.debug(f"Successfully navigated to: {url}")
+            self._logger.debug("Successfully navigated to: %s", url)
             
         except WebDriverException as e:
             error_msg = f"Failed to navigate to {url}: {e}"
@@ -280,6 +384,59 @@ class ChromeBrowser(BaseBrowser):
             self._logger.error(error_msg, exc_info=True)
             raise NavigationError(error_msg) from e
     
+    def get_interactive(self, url: str, selector: Optional[str] = None, timeout: float = 30) -> None:
+        """Navigate to a URL and return once the DOM is usable.
+        
+        Unlike :meth:`get`, this does not wait for the load event (images,
+        fonts, third-party scripts). It returns as soon as the new document
+        has been parsed and, if ``selector`` is given, an element matching
+        it exists.
+        
+        Args:
+            url: The URL to navigate to.
+            selector: Optional CSS selector that must be present before returning.
+            timeout: Maximum time in seconds to wait.
+            
+        Raises:
+            BrowserNotInitializedError: If the browser is not running.
+            NavigationError: If navigation fails or the page is not ready in time.
+        """
+        self._check_browser_initialized()
+        
+        try:
+            self._logger.info(f"Navigating to: {url}")
+            token = uuid.uuid4().hex
+            start_url = self._driver.execute_script(_START_NAVIGATION_SCRIPT, url, token)
+            # A fragment-only change keeps the document, so there is no new
+            # one to wait for
+            if _is_same_document(start_url or '', url):
+                token = None
+            # Unless the strategy is 'none', ChromeDriver lets a pending
+            # navigation finish before running the next script, so a marked
+            # document still in place was not replaced (204, download, blocked)
+            settled = getattr(self._config, 'page_load_strategy', 'normal') != 'none'
+            
+            def dom_ready(driver):
+                ready = driver.execute_script(_DOM_READY_SCRIPT, selector, token)
+                if ready is None:
+                    return settled
+                return ready
+            
+            WebDriverWait(
+                self._driver, timeout, poll_frequency=DEFAULT_POLL_FREQUENCY
+            ).until(dom_ready)
+            self._logger.debug("DOM ready at: %s", url)
+            
+        except TimeoutException as e:
+            error_msg = f"Timeout waiting for {url} to become interactive"
+            self._logger.error(error_msg)
+            raise NavigationError(error_msg) from e
+            
+        except WebDriverException as e:
+            error_msg = f"Failed to navigate to {url}: {e}"
+            self._logger.error(error_msg)
+            raise NavigationError(error_msg) from e
+    
     def back(self) -> None:
         """Go back to the previous page in browser history.
         
@@ -353,9 +510,9 @@ class ChromeBrowser(BaseBrowser):
         self._check_browser_initialized()
         
         try:
-            self._logger.debug(f"Setting window size to {width}x{height}")
+            self._logger.debug("Setting window size to %sx%s", width, height)
             self._driver.set_window_size(width, height)
-            self._logger.debug(f"Window size set to {width}x{height}")
+            self._logger.debug("Window size set to %sx%s", width, height)
             
         except WebDriverException as e:
             error_msg = f"Failed to set window size: {e}"
@@ -449,11 +606,16 @@ class ChromeBrowser(BaseBrowser):
         
         try:
             self._logger.debug("Opening new tab")
+            existing = set(self._driver.window_handles)
             self._driver.execute_script("window.open('');")
             
-            # Get the new window handle
-            new_window = [handle for handle in self._driver.window_handles 
-                        if handle != self._driver.current_window_handle][-1]
+            # The new handle is the one that wasn't there before; this costs
+            # one window_handles call instead of a current_window_handle
+            # round trip per open tab
+            new_window = next(
+                handle for handle in self._driver.window_handles
+                if handle not in existing
+            )
             
             if switch:
                 self.switch_to_tab(new_window)
@@ -462,7 +624,7 @@ class ChromeBrowser(BaseBrowser):
             if url:
                 self.get(url)
             
-            self._logger.debug(f"Opened new tab with handle: {new_window}")
+            self._logger.debug("Opened new tab with handle: %s", new_window)
             return new_window
             
         except WebDriverException as e:
@@ -489,7 +651,7 @@ class ChromeBrowser(BaseBrowser):
                 if window_handle != self._driver.current_window_handle:
                     self.switch_to_tab(window_handle)
             
-            self._logger.debug(f"Closing tab with handle: {window_handle or 'current'}")
+            self._logger.debug("Closing tab with handle: %s", window_handle or 'current')
             self._driver.close()
             self._logger.debug("Tab closed successfully")
             
@@ -514,7 +676,7 @@ class ChromeBrowser(BaseBrowser):
             if window_handle not in self._driver.window_handles:
                 raise BrowserError(f"No such window handle: {window_handle}")
                 
-            self._logger.debug(f"Switching to tab with handle: {window_handle}")
+            self._logger.debug("Switching to tab with handle: %s", window_handle)
             self._driver.switch_to.window(window_handle)
             self._logger.debug("Successfully switched tabs")
             
@@ -547,6 +709,71 @@ class ChromeBrowser(BaseBrowser):
         self._check_browser_initialized()
         return self._driver.window_handles
     
+    def wait_for_window_close(self, timeout: float) -> bool:
+        """Wait until the user closes the browser window, up to a timeout.
+        
+        Lets interactive sessions end as soon as the window is closed rather
+        than blocking on stdin or a fixed sleep.
+        
+        Args:
+            timeout: Maximum time to wait in seconds.
+            
+        Returns:
+            True if the window was closed, False if the timeout expired.
+            
+        Raises:
+            BrowserNotInitializedError: If the browser is not running.
+        """
+        self._check_browser_initialized()
+        try:
+            WebDriverWait(self._driver, timeout, poll_frequency=1.0).until(
+                lambda d: not d.window_handles
+            )
+            return True
+        except TimeoutException:
+            return False
+        except WebDriverException:
+            # The session goes away once the last window is closed
+            return True
+    
+    def wait_for_url_matches(self, pattern: str, timeout: float = 10) -> bool:
+        """Wait until the current URL matches a regex pattern.
+        
+        Args:
+            pattern: Regex searched for in the current URL.
+            timeout: Maximum time to wait in seconds.
+            
+        Returns:
+            True if the URL matched, False if the timeout expired.
+            
+        Raises:
+            BrowserNotInitializedError: If the browser is not running.
+        """
+        self._check_browser_initialized()
+        # A pattern with no regex metacharacters is a plain substring test
+        literal = pattern if re.escape(pattern) == pattern else None
+        regex = re.compile(pattern) if literal is None else None
+        last_url = None
+        
+        def url_matches(driver: Any) -> bool:
+            nonlocal last_url
+            current_url = driver.current_url
+            # Skip the regex entirely while the URL hasn't changed
+            if current_url == last_url:
+                return False
+            last_url = current_url
+            if literal is not None:
+                return literal in current_url
+            return bool(regex.search(current_url))
+        
+        try:
+            WebDriverWait(
+                self._driver, timeout, poll_frequency=DEFAULT_POLL_FREQUENCY
+            ).until(url_matches)
+            return True
+        except TimeoutException:
+            return False
+    
     # Page Information
     
     def get_current_url(self) -> str:
@@ -585,6 +812,24 @@ class ChromeBrowser(BaseBrowser):
         self._check_browser_initialized()
         return self._driver.page_source
     
+    def page_contains(self, text: str) -> bool:
+        """Check whether the page markup contains the text, ignoring case.
+        
+        Equivalent to ``text.lower() in get_page_source().lower()`` but the
+        search runs in the browser, so a large page is not transferred.
+        
+        Args:
+            text: Text to look for.
+            
+        Returns:
+            True if the text occurs in the page.
+            
+        Raises:
+            BrowserNotInitializedError: If the browser is not running.
+        """
+        self._check_browser_initialized()
+        return bool(self._driver.execute_script(_PAGE_CONTAINS_SCRIPT, text))
+    
     # Helper Methods
     
     # Cookie Management
@@ -605,7 +850,7 @@ class ChromeBrowser(BaseBrowser):
         
         try:
             cookie = {'name': name, 'value': value, **kwargs}
-            self._logger.debug(f"Adding cookie: {name}={value}")
+            self._logger.debug("Adding cookie: %s=%s", name, value)
             self._driver.add_cookie(cookie)
             self._logger.debug("Cookie added successfully")
             
@@ -614,6 +859,48 @@ class ChromeBrowser(BaseBrowser):
             self._logger.error(error_msg)
             raise BrowserError(error_msg) from e
     
+    def add_cookies(self, cookies: List[Dict[str, Any]]) -> None:
+        """Add several cookies in a single command.
+        
+        Uses the CDP ``Network.setCookies`` command instead of one
+        ``add_cookie`` round trip per cookie. Cookies without a domain are
+        set for the current page's URL.
+        
+        Args:
+            cookies: Cookie dictionaries as returned by ``get_all_cookies``.
+            
+        Raises:
+            BrowserNotInitializedError: If the browser is not running.
+            BrowserError: If setting the cookies fails.
+        """
+        self._check_browser_initialized()
+        if not cookies:
+            return
+        
+        try:
+            current_url = None
+            params = []
+            for cookie in cookies:
+                param = {'name': cookie['name'], 'value': cookie['value']}
+                if cookie.get('domain'):
+                    param['domain'] = cookie['domain']
+                else:
+                    if current_url is None:
+                        current_url = self._driver.current_url
+                    param['url'] = current_url
+                for key, cdp_key in _CDP_COOKIE_FIELDS:
+                    if cookie.get(key) is not None:
+                        param[cdp_key] = cookie[key]
+                params.append(param)
+            
+            self._driver.execute_cdp_cmd("Network.setCookies", {"cookies": params})
+            self._logger.debug("Added %d cookies", len(params))
+            
+        except (KeyError, WebDriverException) as e:
+            error_msg = f"Failed to add cookies: {e}"
+            self._logger.error(error_msg)
+            raise BrowserError(error_msg) from e
+    
     def get_cookie(self, name: str) -> Optional[Dict[str, Any]]:
         """Get a cookie by name.
         
@@ -654,7 +941,7 @@ class ChromeBrowser(BaseBrowser):
         self._check_browser_initialized()
         
         try:
-            self._logger.debug(f"Deleting cookie: {name}")
+            self._logger.debug("Deleting cookie: %s", name)
             self._driver.delete_cookie(name)
             self._logger.debug("Cookie deleted successfully")
             
@@ -682,6 +969,35 @@ class ChromeBrowser(BaseBrowser):
             self._logger.error(error_msg)
             raise BrowserError(error_msg) from e
     
+    # Local Storage
+    
+    def set_local_storage(self, items: Dict[str, str], clear: bool = False) -> None:
+        """Write several localStorage entries for the current origin at once.
+        
+        All entries are written in one script call instead of one
+        ``setItem`` round trip per key.
+        
+        Args:
+            items: Mapping of keys to string values.
+            clear: Whether to clear existing entries first.
+            
+        Raises:
+            BrowserNotInitializedError: If the browser is not running.
+            BrowserError: If writing to localStorage fails.
+        """
+        self._check_browser_initialized()
+        if not items and not clear:
+            return
+        
+        try:
+            self._driver.execute_script(_SET_LOCAL_STORAGE_SCRIPT, items, clear)
+            self._logger.debug("Set %d localStorage items", len(items))
+            
+        except WebDriverException as e:
+            error_msg = f"Failed to set localStorage items: {e}"
+            self._logger.error(error_msg)
+            raise BrowserError(error_msg) from e
+    
     # Screenshot Methods
     
     def take_screenshot(self, filepath: Optional[str] = None) -> Union[bytes, str]:
@@ -705,15 +1021,7 @@ class ChromeBrowser(BaseBrowser):
             screenshot = self._driver.get_screenshot_as_png()
             
             if filepath:
-                try:
-                    with open(filepath, 'wb') as f:
-                        f.write(screenshot)
-                    self._logger.debug(f"Screenshot saved to {filepath}")
-                    return filepath
-                except IOError as e:
-                    error_msg = f"Failed to save screenshot to {filepath}: {e}"
-                    self._logger.error(error_msg)
-                    raise ScreenshotError(error_msg) from e
+                return self._save_screenshot(filepath, screenshot)
             
             self._logger.debug("Screenshot taken successfully")
             return screenshot
@@ -723,12 +1031,18 @@ class ChromeBrowser(BaseBrowser):
             self._logger.error(error_msg)
             raise ScreenshotError(error_msg) from e
     
-    def take_element_screenshot(self, element, filepath: Optional[str] = None) -> Union[bytes, str]:
+    def take_element_screenshot(
+        self,
+        element,
+        filepath: Optional[str] = None,
+        highlight: bool = False
+    ) -> Union[bytes, str]:
         """Take a screenshot of a specific element.
         
         Args:
             element: The WebElement to capture.
             filepath: Optional path to save the screenshot. If None, returns the image as bytes.
+            highlight: If True, draw a red border around the element for the capture.
             
         Returns:
             If filepath is None, returns the screenshot as bytes.
@@ -742,18 +1056,22 @@ class ChromeBrowser(BaseBrowser):
         
         try:
             self._logger.debug("Taking element screenshot")
-            screenshot = element.screenshot_as_png
+            if highlight:
+                original_style = self._driver.execute_script(
+                    _SWAP_STYLE_SCRIPT, element, ELEMENT_HIGHLIGHT_STYLE
+                )
+                try:
+                    screenshot = element.screenshot_as_png
+                finally:
+                    self._driver.execute_script(
+                        "arguments[0].setAttribute('style', arguments[1]);",
+                        element, original_style
+                    )
+            else:
+                screenshot = element.screenshot_as_png
             
             if filepath:
-                try:
-                    with open(filepath, 'wb') as f:
-                        f.write(screenshot)
-                    self._logger.debug(f"Element screenshot saved to {filepath}")
-                    return filepath
-                except IOError as e:
-                    error_msg = f"Failed to save element screenshot to {filepath}: {e}"
-                    self._logger.error(error_msg)
-                    raise ScreenshotError(error_msg)
+                return self._save_screenshot(filepath, screenshot)
             
             self._logger.debug("Element screenshot taken successfully")
             return screenshot
@@ -765,6 +1083,35 @@ class ChromeBrowser(BaseBrowser):
     
     # Helper Methods
     
+    def _save_screenshot(self, filepath: str, png: bytes) -> str:
+        """Write PNG bytes to a file, creating its directory if needed.
+        
+        Args:
+            filepath: Destination file.
+            png: PNG image data.
+            
+        Returns:
+            The filepath the screenshot was saved to.
+            
+        Raises:
+            ScreenshotError: If the file cannot be written.
+        """
+        try:
+            directory = os.path.dirname(os.path.abspath(filepath))
+            # Screenshots usually go to the same few directories; skip the
+            # makedirs syscalls once a directory is known to exist
+            if directory not in self._screenshot_dirs:
+                os.makedirs(directory, exist_ok=True)
+                self._screenshot_dirs.add(directory)
+            with open(filepath, 'wb') as f:
+                f.write(png)
+        except OSError as e:
+            error_msg = f"Failed to save screenshot to {filepath}: {e}"
+            self._logger.error(error_msg)
+            raise ScreenshotError(error_msg) from e
+        self._logger.debug("Screenshot saved to %s", filepath)
+        return filepath
+    
     # JavaScript Execution
     
     def execute_script(self, script: str, *args) -> Any:
@@ -784,7 +1131,7 @@ class ChromeBrowser(BaseBrowser):
         self._check_browser_initialized()
         
         try:
-            self._logger.debug(f"Executing JavaScript: {script[:100]}...")
+            self._logger.debug("Executing JavaScript: %.100s...", script)
             result = self._driver.execute_script(script, *args)
             return result
             
@@ -810,7 +1157,7 @@ class ChromeBrowser(BaseBrowser):
         self._check_browser_initialized()
         
         try:
-            self._logger.debug(f"Executing async JavaScript: {script[:100]}...")
+            self._logger.debug("Executing async JavaScript: %.100s...", script)
             result = self._driver.execute_async_script(script, *args)
             return result
             
@@ -819,6 +1166,33 @@ class ChromeBrowser(BaseBrowser):
             self._logger.error(error_msg)
             raise BrowserError(error_msg) from e
     
+    # Network
+    
+    def block_urls(self, patterns: Optional[List[str]] = None) -> None:
+        """Block requests whose URL matches any of the given patterns.
+        
+        Uses the CDP ``Network.setBlockedURLs`` command, so blocked resources
+        never hold up the page load event. Call with an empty list to lift
+        the block. Repeating the patterns already in effect sends nothing.
+        
+        Args:
+            patterns: URL patterns (``*`` wildcards). Defaults to
+                DEFAULT_BLOCKED_URL_PATTERNS (analytics, fonts and images).
+            
+        Raises:
+            BrowserNotInitializedError: If the browser is not running.
+        """
+        self._check_browser_initialized()
+        patterns = tuple(DEFAULT_BLOCKED_URL_PATTERNS if patterns is None else patterns)
+        if patterns == self._blocked_urls:
+            return
+        # The network domain stays enabled for the session once turned on
+        if self._blocked_urls is None:
+            self._driver.execute_cdp_cmd("Network.enable", {})
+        self._driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+        self._blocked_urls = patterns
+        self._logger.debug("Blocked URL patterns: %s", patterns)
+    
     # Alert Handling
     
     def accept_alert(self) -> None:
@@ -896,6 +1270,11 @@ class ChromeBrowser(BaseBrowser):
     def set_implicit_wait(self, timeout: float) -> None:
         """Set the amount of time to wait for implicit element location.
         
+        Waits in this package are explicit and assume an implicit wait of
+        0, which is what a started browser uses (``config.implicit_wait``
+        is not applied). A non-zero value makes every failed poll of those
+        waits block for it as well.
+        
         Args:
             timeout: Time to wait in seconds.
             
@@ -956,10 +1335,9 @@ class ChromeBrowser(BaseBrowser):
             BrowserNotInitializedError: If the browser is not running.
         """
         self._check_browser_initialized()
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        
-        return WebDriverWait(self._driver, timeout).until(
+        return WebDriverWait(
+            self._driver, timeout, poll_frequency=DEFAULT_POLL_FREQUENCY
+        ).until(
             EC.presence_of_element_located((by, value))
         )
     
@@ -1045,6 +1423,21 @@ class ChromeBrowser(BaseBrowser):
             self._service = self._create_service()
         return self._service
     
+    def _set_connection_pool_size(self, size: int) -> None:
+        """Resize the urllib3 pool used to talk to chromedriver.
+        
+        Waits polling from worker threads otherwise queue behind a single
+        connection and trigger "connection pool is full" warnings.
+        
+        Args:
+            size: Maximum number of connections kept per host.
+        """
+        pool_manager = self._driver.command_executor._conn
+        pool_manager.connection_pool_kw['maxsize'] = size
+        # Existing pools keep their old size, so drop them to pick up the new one
+        pool_manager.clear()
+        self._logger.debug("Connection pool size set to %d", size)
+    
     def _setup_options(self) -> ChromeOptions:
         """Set up Chrome options based on configuration.
         
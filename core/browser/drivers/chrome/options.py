@@ -3,12 +3,18 @@
 This module provides a class for configuring Chrome browser options in a type-safe way.
 """
 import logging
+import os
 from typing import Any, Dict, List, Optional, Tuple, Union
 from pathlib import Path
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 
 from ....types import BrowserConfig, WindowSize
 
+# Browser, driver and performance logs are buffered by Chrome even when
+# nobody reads them; they stay on only when explicitly requested
+DEBUG_LOGS = os.environ.get("CHROME_PUPPET_DEBUG_LOGS", "0") == "1"
+_LOGGING_OFF = {'browser': 'OFF', 'driver': 'OFF', 'performance': 'OFF'}
+
 
 class ChromeOptionsBuilder:
     """Builder for Chrome browser options."""
@@ -26,6 +32,8 @@ class ChromeOptionsBuilder:
         self._window_size: Optional[Tuple[int, int]] = None
         self._headless: bool = False
         self._user_agent: Optional[str] = None
+        self._logging_prefs: Optional[Dict[str, str]] = None
+        self._page_load_strategy: Optional[str] = None
         self._logger = logging.getLogger(__name__)
         
         if config:
@@ -60,6 +68,17 @@ class ChromeOptionsBuilder:
         if hasattr(config, 'experimental_options') and config.experimental_options:
             for key, value in config.experimental_options.items():
                 self.set_experimental_option(key, value)
+        
+        if getattr(config, 'page_load_strategy', None):
+            self.set_page_load_strategy(config.page_load_strategy)
+        
+        # Explicit logging preferences take precedence over the default
+        if getattr(config, 'logging_prefs', None):
+            self._logging_prefs = dict(config.logging_prefs)
+        
+        # Attach to a running Chrome instead of launching one
+        if getattr(config, 'debugger_address', None):
+            self.set_debugger_address(config.debugger_address)
                 
         return self
     
@@ -171,6 +190,35 @@ class ChromeOptionsBuilder:
         self._experimental_options[name] = value
         return self
     
+    def set_debugger_address(self, address: str) -> 'ChromeOptionsBuilder':
+        """Attach to an already running Chrome instead of launching a new one.
+        
+        The target Chrome must have been started with
+        ``--remote-debugging-port``. Reusing it skips browser start-up and
+        keeps its existing logged-in state.
+        
+        Args:
+            address: Debugger address as ``host:port`` (e.g. ``127.0.0.1:9222``).
+            
+        Returns:
+            Self for method chaining.
+        """
+        return self.set_experimental_option('debuggerAddress', address)
+    
+    def set_page_load_strategy(self, strategy: str) -> 'ChromeOptionsBuilder':
+        """Set how long ``get()`` blocks while a page loads.
+        
+        Args:
+            strategy: 'normal', 'eager' (return at DOMContentLoaded) or 'none'.
+            
+        Returns:
+            Self for method chaining.
+        """
+        if strategy not in ('normal', 'eager', 'none'):
+            raise ValueError(f"Invalid page load strategy: {strategy}")
+        self._page_load_strategy = strategy
+        return self
+    
     def build(self) -> ChromeOptions:
         """Build the Chrome options.
         
@@ -189,7 +237,15 @@ class ChromeOptionsBuilder:
             
         # Add experimental options
         for key, value in self._experimental_options.items():
-            options.set_experimental_option(key, value)
+            options.add_experimental_option(key, value)
+        
+        if self._page_load_strategy:
+            options.page_load_strategy = self._page_load_strategy
+        
+        if self._logging_prefs is not None:
+            options.set_capability('goog:loggingPrefs', self._logging_prefs)
+        elif not DEBUG_LOGS:
+            options.set_capability('goog:loggingPrefs', _LOGGING_OFF)
             
         return options
     
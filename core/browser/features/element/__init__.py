@@ -7,17 +7,20 @@ Submodules:
     - finders: Element finding functionality
     - actions: Element interaction actions
     - wait: Element wait functionality
+    - helper: ElementHelper wrapping a browser's driver
 """
 
 from .base import BaseElement
 from .finders import ElementFindersMixin
 from .actions import ElementActionsMixin
 from .wait import ElementWaitMixin, retry_on_stale_element
+from .helper import ElementHelper
 
 __all__ = [
     'BaseElement',
     'ElementFindersMixin',
     'ElementActionsMixin',
     'ElementWaitMixin',
-    'retry_on_stale_element'
+    'retry_on_stale_element',
+    'ElementHelper'
 ]
@@ -7,7 +7,7 @@ from selenium.common.exceptions import (
     StaleElementReferenceException
 )
 
-from ..exceptions import ElementNotInteractableError
+from ...exceptions import ElementNotInteractableError
 
 class ElementActionsMixin:
     """Mixin class providing element interaction methods."""
@@ -12,12 +12,58 @@ from selenium.common.exceptions import (
     TimeoutException
 )
 
-from ..exceptions import (
+from ...base import DEFAULT_POLL_FREQUENCY
+from ...exceptions import (
     ElementNotFoundError,
     ElementNotInteractableError,
     TimeoutError as BrowserTimeoutError
 )
 
+# Reconciles checkbox/radio state in one pass; click() fires the same
+# input/change events a user toggle would, so page frameworks stay in sync.
+_SET_CHECKED_SCRIPT = """
+var root = arguments[0] || document, states = arguments[1], missing = [];
+Object.keys(states).forEach(function(selector) {
+    var el = root.querySelector(selector);
+    if (!el) { missing.push(selector); return; }
+    if (el.checked !== states[selector]) { el.click(); }
+});
+return missing;
+"""
+
+# Sets a field's value in one call and fires the events a framework listens
+# for; returns false without touching the field if it already holds the value.
+_SET_VALUE_SCRIPT = """
+var el = arguments[0], value = arguments[1];
+if (el.value === value) { return false; }
+el.value = value;
+el.dispatchEvent(new Event('input', {bubbles: true}));
+el.dispatchEvent(new Event('change', {bubbles: true}));
+return true;
+"""
+
+# Single-round-trip equivalent of EC.element_to_be_clickable for ID and CSS
+# locators: returns the element once it is rendered and enabled, else null.
+_CLICKABLE_SCRIPT = """
+var el = arguments[0] ? document.getElementById(arguments[1]) : document.querySelector(arguments[1]);
+if (!el || el.disabled || !el.getClientRects().length) { return null; }
+return window.getComputedStyle(el).visibility !== 'hidden' ? el : null;
+"""
+
+# Selects options of a <select> by visible text or value in one call and
+# fires a single change event; returns the labels that matched nothing.
+_SELECT_OPTIONS_SCRIPT = """
+var select = arguments[0], wanted = arguments[1], found = {};
+Array.prototype.forEach.call(select.options, function(option) {
+    var label = option.text.trim();
+    var hit = wanted.indexOf(label) !== -1 ? label : (wanted.indexOf(option.value) !== -1 ? option.value : null);
+    if (hit !== null) { found[hit] = true; }
+    if (select.multiple || hit !== null) { option.selected = hit !== null; }
+});
+select.dispatchEvent(new Event('change', {bubbles: true}));
+return wanted.filter(function(w) { return !found[w]; });
+"""
+
 class ElementHelper:
     """Helper class for web element interactions."""
     
@@ -36,6 +82,32 @@ class ElementHelper:
         if self.logger:
             getattr(self.logger, level)(message, *args, **kwargs)
     
+    def _resolve_element(
+        self,
+        by: str,
+        value: Optional[str],
+        element: Optional[WebElement],
+        timeout: Optional[float],
+        wait: Callable[..., WebElement]
+    ) -> WebElement:
+        """Return the given element or locate it exactly once.
+        
+        Args:
+            by: Locator strategy (used if element is None)
+            value: The locator value (used if element is None)
+            element: Already located element, returned as-is
+            timeout: Maximum time to wait; uses ``wait`` when positive
+            wait: Wait helper that applies the caller's readiness condition
+            
+        Returns:
+            WebElement: The resolved web element
+        """
+        if element is not None:
+            return element
+        if timeout is not None and timeout > 0:
+            return wait(by=by, value=value, timeout=timeout)
+        return self.find_element(by, value)
+    
     def find_element(
         self,
         by: str = By.ID,
@@ -60,17 +132,15 @@ class ElementHelper:
         if not value:
             raise ValueError("Value cannot be empty")
             
+        context = self.driver if parent is None else parent
         try:
             if timeout is not None and timeout > 0:
-                wait = WebDriverWait(
-                    self.driver if parent is None else parent,
-                    timeout
-                )
-                return wait.until(EC.presence_of_element_located((by, value)))
+                # Explicit wait only; the driver's implicit wait is left at 0
+                # so a missing element costs one lookup per poll
+                wait = WebDriverWait(context, timeout, poll_frequency=DEFAULT_POLL_FREQUENCY)
+                return wait.until(lambda ctx: ctx.find_element(by, value))
             
-            if parent is not None:
-                return parent.find_element(by, value)
-            return self.driver.find_element(by, value)
+            return context.find_element(by, value)
             
         except (NoSuchElementException, TimeoutException) as e:
             self._log('debug', f"Element not found: {by}={value}")
@@ -104,7 +174,8 @@ class ElementHelper:
             if timeout is not None and timeout > 0:
                 wait = WebDriverWait(
                     self.driver if parent is None else parent,
-                    timeout
+                    timeout,
+                    poll_frequency=DEFAULT_POLL_FREQUENCY
                 )
                 return wait.until(
                     EC.presence_of_all_elements_located((by, value))
@@ -139,7 +210,7 @@ class ElementHelper:
             TimeoutError: If element is not visible within timeout
         """
         try:
-            wait = WebDriverWait(self.driver, timeout)
+            wait = WebDriverWait(self.driver, timeout, poll_frequency=DEFAULT_POLL_FREQUENCY)
             return wait.until(EC.visibility_of_element_located((by, value)))
         except TimeoutException as e:
             raise BrowserTimeoutError(
@@ -165,9 +236,16 @@ class ElementHelper:
         Raises:
             TimeoutError: If element is not clickable within timeout
         """
+        if by in (By.ID, By.CSS_SELECTOR):
+            # One execute_script per poll instead of find + is_displayed + is_enabled
+            is_id = by == By.ID
+            condition = lambda d: d.execute_script(_CLICKABLE_SCRIPT, is_id, value) or False
+        else:
+            condition = EC.element_to_be_clickable((by, value))
+        
         try:
-            wait = WebDriverWait(self.driver, timeout)
-            return wait.until(EC.element_to_be_clickable((by, value)))
+            wait = WebDriverWait(self.driver, timeout, poll_frequency=DEFAULT_POLL_FREQUENCY)
+            return wait.until(condition)
         except TimeoutException as e:
             raise BrowserTimeoutError(
                 f"Element not clickable after {timeout} seconds: {by}={value}"
@@ -191,16 +269,11 @@ class ElementHelper:
         Raises:
             ElementNotInteractableError: If the element is not interactable
         """
-        target = element or self.find_element(by, value, timeout=timeout)
+        target = self._resolve_element(
+            by, value, element, timeout, self.wait_for_element_clickable
+        )
         
         try:
-            if timeout is not None and timeout > 0:
-                target = self.wait_for_element_clickable(
-                    by=by,
-                    value=value,
-                    timeout=timeout
-                )
-            
             target.click()
             
         except (ElementClickInterceptedException, ElementNotInteractableException) as e:
@@ -231,16 +304,11 @@ class ElementHelper:
         Raises:
             ElementNotInteractableError: If the element is not interactable
         """
-        target = element or self.find_element(by, value, timeout=timeout)
+        target = self._resolve_element(
+            by, value, element, timeout, self.wait_for_element_visible
+        )
         
         try:
-            if timeout is not None and timeout > 0:
-                target = self.wait_for_element_visible(
-                    by=by,
-                    value=value,
-                    timeout=timeout
-                )
-            
             if clear_first:
                 target.clear()
             
@@ -252,6 +320,45 @@ class ElementHelper:
                 f"Element not interactable: {by}={value if value else 'element'}"
             ) from e
     
+    def set_value(
+        self,
+        text: str,
+        by: str = By.ID,
+        value: Optional[str] = None,
+        element: Optional[WebElement] = None,
+        timeout: Optional[float] = None
+    ) -> bool:
+        """Set an input's value directly instead of typing it key by key.
+        
+        Useful for re-filling fields (e.g. after autofill or a retry) where
+        keystroke-level input is not needed. Does nothing if the field
+        already holds the value.
+        
+        Args:
+            text: Value to set
+            by: Locator strategy (required if element is None)
+            value: The locator value (required if element is None)
+            element: Optional element to update (alternative to locator)
+            timeout: Maximum time to wait for element to be visible
+            
+        Returns:
+            bool: True if the value was changed, False if it already matched
+            
+        Raises:
+            ElementNotInteractableError: If the element is no longer attached
+        """
+        target = self._resolve_element(
+            by, value, element, timeout, self.wait_for_element_visible
+        )
+        
+        try:
+            return bool(self.driver.execute_script(_SET_VALUE_SCRIPT, target, text))
+        except StaleElementReferenceException as e:
+            self._log('debug', f"Element not interactable: {str(e)}")
+            raise ElementNotInteractableError(
+                f"Element not interactable: {by}={value if value else 'element'}"
+            ) from e
+    
     def get_text(
         self,
         by: str = By.ID,
@@ -270,16 +377,11 @@ class ElementHelper:
         Returns:
             str: The text content of the element
         """
-        target = element or self.find_element(by, value, timeout=timeout)
+        target = self._resolve_element(
+            by, value, element, timeout, self.wait_for_element_visible
+        )
         
         try:
-            if timeout is not None and timeout > 0:
-                target = self.wait_for_element_visible(
-                    by=by,
-                    value=value,
-                    timeout=timeout
-                )
-            
             return target.text
             
         except StaleElementReferenceException as e:
@@ -313,13 +415,73 @@ class ElementHelper:
                 
             if timeout and timeout > 0:
                 try:
-                    element = self.wait_for_element_visible(by, value, timeout)
-                    return element.is_displayed()
+                    # The wait only returns once the element is visible, so
+                    # there is no need for another is_displayed() round trip
+                    self.wait_for_element_visible(by, value, timeout)
+                    return True
                 except (BrowserTimeoutError, ElementNotFoundError):
                     return False
             
-            element = self.find_element(by, value, timeout=0)
-            return element.is_displayed()
+            # An absent element is the common negative case; find_elements
+            # reports it with an empty list instead of an exception
+            elements = self.driver.find_elements(by, value)
+            return bool(elements) and elements[0].is_displayed()
             
         except (NoSuchElementException, StaleElementReferenceException):
             return False
+    
+    def set_checked(
+        self,
+        states: Dict[str, bool],
+        parent: Optional[WebElement] = None
+    ) -> List[str]:
+        """Set the checked state of several checkboxes or radios at once.
+        
+        All elements are reconciled in a single execute_script call; only
+        elements whose state differs from the target are toggled.
+        
+        Args:
+            states: Mapping of CSS selector to desired checked state
+            parent: Optional parent element to search within
+            
+        Returns:
+            List[str]: Selectors that did not match any element
+        """
+        if not states:
+            return []
+        missing = self.driver.execute_script(_SET_CHECKED_SCRIPT, parent, states)
+        if missing:
+            self._log('debug', f"Checkbox selectors not found: {missing}")
+        return missing or []
+    
+    def select_options(
+        self,
+        options: List[str],
+        by: str = By.ID,
+        value: Optional[str] = None,
+        element: Optional[WebElement] = None,
+        timeout: Optional[float] = None
+    ) -> List[str]:
+        """Select options of a <select> element by visible text or value.
+        
+        All options are set in a single execute_script call instead of one
+        click (and wait) per option. For multi-selects, options not listed
+        are deselected.
+        
+        Args:
+            options: Option labels or values to select
+            by: Locator strategy (required if element is None)
+            value: The locator value (required if element is None)
+            element: Optional <select> element (alternative to locator)
+            timeout: Maximum time to wait for element to be visible
+            
+        Returns:
+            List[str]: Requested options that did not match any option
+        """
+        target = self._resolve_element(
+            by, value, element, timeout, self.wait_for_element_visible
+        )
+        missing = self.driver.execute_script(_SELECT_OPTIONS_SCRIPT, target, list(options))
+        if missing:
+            self._log('debug', f"Options not found: {missing}")
+        return missing or []
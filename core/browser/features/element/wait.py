@@ -3,18 +3,43 @@ from typing import Callable, Optional, Any, Type, TypeVar, Union
 from functools import wraps
 import time
 
+from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     TimeoutException,
     StaleElementReferenceException,
-    NoSuchElementException
+    NoSuchElementException,
+    WebDriverException
 )
 
-from ..exceptions import TimeoutError as BrowserTimeoutError
+from ...base import DEFAULT_POLL_FREQUENCY
+from ...exceptions import TimeoutError as BrowserTimeoutError
 
 T = TypeVar('T', bound=Callable)
 
+# Resolves as soon as a MutationObserver sees a matching node, so the wait
+# costs a single WebDriver round trip instead of one per poll interval.
+_MUTATION_WAIT_SCRIPT = """
+var selector = arguments[0], visibleOnly = arguments[1], timeoutMs = arguments[2];
+var done = arguments[arguments.length - 1];
+function match() {
+    var el = document.querySelector(selector);
+    if (!el) return null;
+    if (visibleOnly && !(el.offsetWidth || el.offsetHeight || el.getClientRects().length)) return null;
+    return el;
+}
+var found = match();
+if (found) { done(found); return; }
+var timer = null;
+var observer = new MutationObserver(function() {
+    var el = match();
+    if (el) { observer.disconnect(); clearTimeout(timer); done(el); }
+});
+observer.observe(document.documentElement, {childList: true, subtree: true, attributes: visibleOnly});
+timer = setTimeout(function() { observer.disconnect(); done(null); }, timeoutMs);
+"""
+
 def retry_on_stale_element(max_retries: int = 3, delay: float = 0.5) -> Callable[[T], T]:
     """Decorator to retry a function when a stale element reference occurs.
     
@@ -50,7 +75,7 @@ class ElementWaitMixin:
         by: str,
         value: str,
         timeout: float = 10,
-        poll_frequency: float = 0.5,
+        poll_frequency: float = DEFAULT_POLL_FREQUENCY,
         ignored_exceptions: Optional[list] = None
     ) -> Any:
         """Wait for an element to be present in the DOM.
@@ -86,7 +111,7 @@ class ElementWaitMixin:
         by: str,
         value: str,
         timeout: float = 10,
-        poll_frequency: float = 0.5
+        poll_frequency: float = DEFAULT_POLL_FREQUENCY
     ) -> Any:
         """Wait for an element to be visible in the DOM.
         
@@ -116,7 +141,7 @@ class ElementWaitMixin:
         by: str,
         value: str,
         timeout: float = 10,
-        poll_frequency: float = 0.5
+        poll_frequency: float = DEFAULT_POLL_FREQUENCY
     ) -> Any:
         """Wait for an element to be clickable.
         
@@ -140,3 +165,51 @@ class ElementWaitMixin:
             ).until(EC.element_to_be_clickable((by, value)))
         except TimeoutException as e:
             raise BrowserTimeoutError(f"Timed out waiting for element {by}={value} to be clickable") from e
+    
+    def wait_for_selector(
+        self,
+        selector: str,
+        timeout: float = 10,
+        visible: bool = True
+    ) -> Any:
+        """Wait for a CSS selector to match using a DOM MutationObserver.
+        
+        Unlike the polling waits above, the check runs inside the page and
+        returns on the first matching DOM mutation. If the script cannot run
+        (e.g. the page navigates mid-wait) this falls back to a polling wait.
+        
+        Args:
+            selector: CSS selector of the element to wait for
+            timeout: Maximum time to wait in seconds
+            visible: Whether the element must also be visible
+            
+        Returns:
+            The WebElement once it matches
+            
+        Raises:
+            BrowserTimeoutError: If no element matches within the timeout
+        """
+        deadline = time.monotonic() + timeout
+        # execute_async_script is bounded by the driver's script timeout, not
+        # by ``timeout``; raise it for the wait, with a margin so the script's
+        # own timer reports a miss first
+        previous = self.driver.timeouts.script
+        self.driver.set_script_timeout(timeout + 1)
+        try:
+            try:
+                element = self.driver.execute_async_script(
+                    _MUTATION_WAIT_SCRIPT, selector, visible, int(timeout * 1000)
+                )
+            finally:
+                self.driver.set_script_timeout(previous)
+        except TimeoutException as e:
+            raise BrowserTimeoutError(f"Timed out waiting for selector {selector}") from e
+        except WebDriverException:
+            remaining = max(0.0, deadline - time.monotonic())
+            if visible:
+                return self.wait_for_element_visible(By.CSS_SELECTOR, selector, timeout=remaining)
+            return self.wait_for_element(By.CSS_SELECTOR, selector, timeout=remaining)
+        
+        if element is None:
+            raise BrowserTimeoutError(f"Timed out waiting for selector {selector}")
+        return element
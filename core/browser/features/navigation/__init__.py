@@ -6,14 +6,18 @@ Submodules:
     - base: Base classes for navigation functionality
     - history: Browser history management
     - waiter: Page load waiting functionality
+    - mixin: Navigation mixin combining page loads and URL/title waits
 """
 
 from .base import BaseNavigation
 from .history import NavigationHistoryMixin
 from .waiter import NavigationWaitMixin
+from .mixin import NavigationMixin, wait_for_page_load
 
 __all__ = [
     'BaseNavigation',
     'NavigationHistoryMixin',
-    'NavigationWaitMixin'
+    'NavigationWaitMixin',
+    'NavigationMixin',
+    'wait_for_page_load'
 ]
@@ -12,7 +12,8 @@ from selenium.common.exceptions import (
     WebDriverException
 )
 
-from ..exceptions import (
+from ...base import DEFAULT_POLL_FREQUENCY
+from ...exceptions import (
     NavigationError,
     TimeoutError as BrowserTimeoutError
 )
@@ -39,7 +40,7 @@ def wait_for_page_load(timeout: float = 30.0) -> Callable[[Callable[..., T]], Ca
             
             # Wait for page to be in ready state
             try:
-                WebDriverWait(self.driver, timeout).until(
+                WebDriverWait(self.driver, timeout, poll_frequency=DEFAULT_POLL_FREQUENCY).until(
                     lambda d: d.execute_script('return document.readyState') == 'complete'
                 )
             except TimeoutException as e:
@@ -77,7 +78,8 @@ class NavigationMixin:
             raise NavigationError("Browser is not initialized")
             
         try:
-            self._last_url = self.driver.current_url if hasattr(self.driver, 'current_url') else None
+            # hasattr() would read the property too, costing a second round trip
+            self._last_url = getattr(self.driver, 'current_url', None)
             self.driver.get(url)
             
             # Additional wait if specified
@@ -136,12 +138,12 @@ class NavigationMixin:
         if not hasattr(self, 'driver'):
             return False
             
-        current_url = url or (self.driver.current_url if hasattr(self.driver, 'current_url') else None)
+        current_url = url or getattr(self.driver, 'current_url', None)
         if not current_url:
             return False
             
         try:
-            WebDriverWait(self.driver, timeout).until(
+            WebDriverWait(self.driver, timeout, poll_frequency=DEFAULT_POLL_FREQUENCY).until(
                 lambda d: d.current_url != current_url
             )
             return True
@@ -166,7 +168,7 @@ class NavigationMixin:
             return False
             
         try:
-            WebDriverWait(self.driver, timeout).until(
+            WebDriverWait(self.driver, timeout, poll_frequency=DEFAULT_POLL_FREQUENCY).until(
                 lambda d: text in d.current_url
             )
             return True
@@ -190,9 +192,10 @@ class NavigationMixin:
         if not hasattr(self, 'driver') or not text:
             return False
             
+        expected = text.lower()
         try:
-            WebDriverWait(self.driver, timeout).until(
-                lambda d: text.lower() in d.title.lower()
+            WebDriverWait(self.driver, timeout, poll_frequency=DEFAULT_POLL_FREQUENCY).until(
+                lambda d: expected in d.title.lower()
             )
             return True
         except TimeoutException:
@@ -221,7 +224,7 @@ class NavigationMixin:
             return False
             
         try:
-            WebDriverWait(self.driver, timeout).until(condition)
+            WebDriverWait(self.driver, timeout, poll_frequency=DEFAULT_POLL_FREQUENCY).until(condition)
             return True
         except TimeoutException as e:
             if message:
@@ -1,20 +1,22 @@
 """Page load waiting functionality."""
 from typing import Callable, Optional, Any, Type, TypeVar, Union
 from functools import wraps
+import re
 import time
 
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
 
-from ..exceptions import TimeoutError as BrowserTimeoutError
+from ...base import DEFAULT_POLL_FREQUENCY
+from ...exceptions import TimeoutError as BrowserTimeoutError
 
 T = TypeVar('T', bound=Callable)
 
 class NavigationWaitMixin:
     """Mixin class providing page load waiting functionality."""
     
-    def wait_for_page_load(self, timeout: float = 30, poll_frequency: float = 0.5) -> None:
+    def wait_for_page_load(self, timeout: float = 30, poll_frequency: float = DEFAULT_POLL_FREQUENCY) -> None:
         """Wait for the page to finish loading.
         
         Args:
@@ -39,7 +41,7 @@ class NavigationWaitMixin:
         self,
         text: str,
         timeout: float = 10,
-        poll_frequency: float = 0.5
+        poll_frequency: float = DEFAULT_POLL_FREQUENCY
     ) -> bool:
         """Wait until the URL contains the given text.
         
@@ -67,7 +69,7 @@ class NavigationWaitMixin:
         self,
         pattern: str,
         timeout: float = 10,
-        poll_frequency: float = 0.5
+        poll_frequency: float = DEFAULT_POLL_FREQUENCY
     ) -> bool:
         """Wait until the URL matches the given regex pattern.
         
@@ -82,8 +84,6 @@ class NavigationWaitMixin:
         Raises:
             BrowserTimeoutError: If the URL doesn't match the pattern within the timeout
         """
-        import re
-        
         def url_matches(driver: Any) -> bool:
             current_url = driver.current_url
             return bool(re.search(pattern, current_url))
@@ -2,6 +2,8 @@
 from typing import Dict, Any, Optional, Union, List, Callable, Tuple, TypeVar, cast
 from functools import wraps
 import json
+import re
+import time
 
 from selenium.webdriver import Chrome
 from selenium.webdriver.common.proxy import Proxy, ProxyType
@@ -139,9 +141,6 @@ class NetworkInterceptorMixin(RequestInterceptorMixin, ResponseInterceptorMixin)
         Raises:
             TimeoutError: If no matching request is found within the timeout
         """
-        import time
-        import re
-        
         start_time = time.time()
         while time.time() - start_time < timeout:
             requests = self.get_intercepted_requests()
@@ -120,24 +120,8 @@ class ScreenshotHelper:
             if hasattr(self.driver, 'get_full_page_screenshot_as_png'):
                 return self.driver.get_full_page_screenshot_as_png()
                 
-            # Fallback to viewport stitching (simplified)
-            self._log('debug', "Full page screenshot not natively supported, using viewport stitching")
-            
-            # Get the total page height
-            total_height = self.driver.execute_script(
-                "return Math.max(document.body.scrollHeight, "
-                "document.body.offsetHeight, document.documentElement.clientHeight, "
-                "document.documentElement.scrollHeight, document.documentElement.offsetHeight);"
-            )
-            
-            viewport_height = self.driver.execute_script("return window.innerHeight;")
-            viewport_width = self.driver.execute_script("return window.innerWidth;")
-            
-            # Take multiple screenshots and stitch them together
-            # Note: This is a simplified implementation
-            # A full implementation would need to handle scrolling and stitching
-            
-            # For now, just take a screenshot of the current viewport
+            # Fallback to the current viewport; stitching is not implemented
+            self._log('debug', "Full page screenshot not natively supported, capturing viewport only")
             return self.driver.get_screenshot_as_png()
             
         except Exception as e:
@@ -4,20 +4,48 @@ Profile management for browser automation.
 This module provides functionality to manage browser profiles,
 including listing, validating, and selecting profiles.
 """
+import copy
 import json
 import logging
 import os
 import platform
+import re
 import shutil
 import sqlite3
 import sys
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Union, ClassVar, TypedDict
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple, Union, ClassVar, TypedDict
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Precomputed console strings for select_profile_interactive
+_RULE = "=" * 80
+_THIN_RULE = "-" * 80
+_TABLE_HEADER = f"{'#':>3}  {'Profile Name':<30} {'Email':<30} {'Size':>10}"
+_PROFILE_TYPE_ORDER = {'user': 0, 'development': 1, 'system': 2}
+
+# Upper bound on profiles read concurrently during discovery
+_PROFILE_SCAN_WORKERS = 8
+
+# Files whose contents feed the cached profile details; an entry is reused
+# only while the (mtime_ns, size) of every one of them is unchanged
+_PROFILE_INFO_SOURCES = ('Preferences', 'History', 'Bookmarks', 'Web Data', 'Login Data')
+# Most profiles kept in the cache, least recently used dropped first
+_PROFILE_INFO_CACHE_SIZE = 64
+
+# Profile path -> (signature of _PROFILE_INFO_SOURCES, profile details)
+_profile_info_cache: 'OrderedDict[str, Tuple[Tuple[Any, ...], Dict[str, Any]]]' = OrderedDict()
+_profile_info_cache_lock = threading.Lock()
+
+# Chrome stores timestamps as microseconds since 1601-01-01
+_CHROME_EPOCH = datetime(1601, 1, 1)
+
 class ProfileInfo(TypedDict):
     """Type definition for profile information."""
     name: str
@@ -46,7 +74,13 @@ class ProfileManager:
     ]
     
     # System profiles that should be ignored
-    IGNORED_PROFILES = ["System Profile", "Guest Profile"]
+    IGNORED_PROFILES: ClassVar[FrozenSet[str]] = frozenset({"System Profile", "Guest Profile"})
+    
+    # Lowercase name fragments that mark a development profile
+    DEVELOPMENT_MARKERS: ClassVar[Tuple[str, ...]] = ('dev', 'test', 'staging', 'local')
+    _DEVELOPMENT_RE: ClassVar['re.Pattern[str]'] = re.compile(
+        '|'.join(map(re.escape, DEVELOPMENT_MARKERS)), re.IGNORECASE
+    )
     
     # Known system/development profile names
     SYSTEM_PROFILES = [
@@ -105,7 +139,7 @@ class ProfileManager:
                     self.logger.info(f"Found Chrome user data directory: {data_dir}")
                     return data_dir
             except Exception as e:
-                self.logger.debug(f"Error checking Chrome data directory {data_dir}: {e}")
+                self.logger.debug("Error checking Chrome data directory %s: %s", data_dir, e)
         
         # If we get here, no valid directory was found
         error_msg = (
@@ -132,11 +166,11 @@ class ProfileManager:
             chrome_path = os.path.join(local_app_data, 'Google', 'Chrome', 'User Data')
             
             # Debug output
-            logger.debug(f"Looking for Chrome user data in: {chrome_path}")
+            logger.debug("Looking for Chrome user data in: %s", chrome_path)
             
             # Check if the path exists
             if os.path.exists(chrome_path):
-                logger.debug(f"Found Chrome user data directory: {chrome_path}")
+                logger.debug("Found Chrome user data directory: %s", chrome_path)
                 return chrome_path
             else:
                 # Try alternative locations if the default doesn't exist
@@ -149,7 +183,7 @@ class ProfileManager:
                 for path in alternative_paths:
                     path = os.path.abspath(path)
                     if os.path.exists(path):
-                        logger.debug(f"Found Chrome user data directory (alternative path): {path}")
+                        logger.debug("Found Chrome user data directory (alternative path): %s", path)
                         return path
                 
                 logger.warning(f"Chrome user data directory not found in any standard location")
@@ -172,20 +206,31 @@ class ProfileManager:
         Returns:
             str: Profile type ('system', 'development', or 'user')
         """
-        if any(profile_name == p for p in self.IGNORED_PROFILES):
+        if profile_name in self.IGNORED_PROFILES:
             return 'system'
-        elif any(x in profile_name.lower() for x in ['dev', 'test', 'staging', 'local']):
+        if self._DEVELOPMENT_RE.search(profile_name):
             return 'development'
         return 'user'
         
+    @staticmethod
+    def _has_data(path: Path) -> bool:
+        """Check that a profile database exists and is not empty.
+        
+        Fresh profiles often have zero-byte databases; skipping them avoids
+        opening a SQLite connection just to hit missing tables.
+        """
+        try:
+            return path.stat().st_size > 0
+        except OSError:
+            return False
+        
     def _get_web_data_info(self, profile_path: Path, info: Dict[str, Any]) -> None:
         """Extract information from Web Data database."""
         web_data_path = profile_path / 'Web Data'
-        if not web_data_path.exists():
+        if not self._has_data(web_data_path):
             return
             
         try:
-            import sqlite3
             conn = sqlite3.connect(f'file:{web_data_path}?mode=ro', uri=True)
             cursor = conn.cursor()
             
@@ -206,17 +251,15 @@ class ProfileManager:
             conn.close()
             
         except Exception as e:
-            logger.debug(f"Error reading Web Data: {e}")
+            logger.debug("Error reading Web Data: %s", e)
     
     def _get_history_info(self, profile_path: Path, info: Dict[str, Any]) -> None:
         """Extract information from History database."""
         history_path = profile_path / 'History'
-        if not history_path.exists():
+        if not self._has_data(history_path):
             return
             
         try:
-            import sqlite3
-            from datetime import datetime, timedelta
             
             conn = sqlite3.connect(f'file:{history_path}?mode=ro', uri=True)
             cursor = conn.cursor()
@@ -231,26 +274,24 @@ class ProfileManager:
                 last_visit = cursor.fetchone()
                 if last_visit and last_visit[0]:
                     # Convert Chrome time (microseconds since 1601) to datetime
-                    epoch_start = datetime(1601, 1, 1)
-                    last_visit_dt = epoch_start + timedelta(microseconds=last_visit[0])
+                    last_visit_dt = _CHROME_EPOCH + timedelta(microseconds=last_visit[0])
                     info['last_visit_time'] = last_visit_dt.isoformat()
                     
             except sqlite3.OperationalError as e:
-                logger.debug(f"Error reading history: {e}")
+                logger.debug("Error reading history: %s", e)
                 
             conn.close()
             
         except Exception as e:
-            logger.debug(f"Error reading History: {e}")
+            logger.debug("Error reading History: %s", e)
     
     def _get_login_data_info(self, profile_path: Path, info: Dict[str, Any]) -> None:
         """Extract information from Login Data database."""
         login_data_path = profile_path / 'Login Data'
-        if not login_data_path.exists():
+        if not self._has_data(login_data_path):
             return
             
         try:
-            import sqlite3
             conn = sqlite3.connect(f'file:{login_data_path}?mode=ro', uri=True)
             cursor = conn.cursor()
             
@@ -263,7 +304,7 @@ class ProfileManager:
             conn.close()
             
         except Exception as e:
-            logger.debug(f"Error reading Login Data: {e}")
+            logger.debug("Error reading Login Data: %s", e)
     
     def _get_bookmark_info(self, profile_path: Path, info: Dict[str, Any]) -> None:
         """Extract information from Bookmarks file."""
@@ -272,24 +313,24 @@ class ProfileManager:
             return
             
         try:
-            with open(bookmarks_path, 'r', encoding='utf-8') as f:
-                bookmarks = json.load(f)
-                
-            def count_bookmarks(node):
-                count = 0
-                if 'children' in node:
-                    for child in node['children']:
-                        count += count_bookmarks(child)
-                if 'type' in node and node['type'] == 'url':
-                    return 1
-                return count
+            # json decodes UTF-8 bytes itself, skipping the text-mode wrapper
+            bookmarks = json.loads(bookmarks_path.read_bytes())
                 
+            # Walk the tree with an explicit stack; url nodes are leaves, so
+            # only folders are expanded
             if 'roots' in bookmarks:
-                for root in bookmarks['roots'].values():
-                    info['bookmark_count'] += count_bookmarks(root)
+                stack = [root for root in bookmarks['roots'].values() if isinstance(root, dict)]
+                count = 0
+                while stack:
+                    node = stack.pop()
+                    if node.get('type') == 'url':
+                        count += 1
+                    elif 'children' in node:
+                        stack.extend(node['children'])
+                info['bookmark_count'] += count
                     
         except Exception as e:
-            logger.debug(f"Error reading bookmarks: {e}")
+            logger.debug("Error reading bookmarks: %s", e)
     
     def _get_profile_info(self, profile_path: Path) -> Dict[str, Any]:
         """Get additional information about a profile.
@@ -365,8 +406,7 @@ class ProfileManager:
                 
             # Parse Preferences file
             try:
-                with open(prefs_file, 'r', encoding='utf-8', errors='replace') as f:
-                    prefs = json.load(f)
+                prefs = json.loads(prefs_file.read_bytes().decode('utf-8', 'replace'))
                 
                 # Extract account information
                 if 'profile' in prefs:
@@ -481,10 +521,84 @@ class ProfileManager:
             
         return info
     
+    def _get_cached_profile_info(self, profile_path: Path) -> Dict[str, Any]:
+        """Get profile information, reusing an earlier result if the profile is unchanged.
+        
+        The size and modification time change with any file in the profile,
+        so they are always read fresh; everything else is reused while the
+        files it was read from are unchanged.
+        
+        Args:
+            profile_path: Path to the profile directory
+            
+        Returns:
+            Dict containing detailed profile information
+        """
+        try:
+            (profile_path / 'Preferences').stat()
+        except OSError:
+            return self._get_profile_info(profile_path)
+        
+        signature = []
+        for name in _PROFILE_INFO_SOURCES:
+            try:
+                stat_info = (profile_path / name).stat()
+                signature.append((stat_info.st_mtime_ns, stat_info.st_size))
+            except OSError:
+                signature.append(None)
+        signature = tuple(signature)
+        
+        key = str(profile_path.absolute())
+        with _profile_info_cache_lock:
+            entry = _profile_info_cache.get(key)
+            if entry is not None and entry[0] == signature:
+                _profile_info_cache.move_to_end(key)
+                info = copy.deepcopy(entry[1])
+            else:
+                info = None
+        
+        if info is not None:
+            try:
+                info.update({
+                    'size_mb': self._get_directory_size(profile_path) / (1024 * 1024),
+                    'last_modified': profile_path.stat().st_mtime
+                })
+            except OSError:
+                pass
+            return info
+        
+        info = self._get_profile_info(profile_path)
+        if info.get('is_valid'):
+            with _profile_info_cache_lock:
+                _profile_info_cache[key] = (signature, copy.deepcopy(info))
+                _profile_info_cache.move_to_end(key)
+                while len(_profile_info_cache) > _PROFILE_INFO_CACHE_SIZE:
+                    _profile_info_cache.popitem(last=False)
+        return info
+    
     @staticmethod
     def _get_directory_size(path: Path) -> int:
-        """Calculate the total size of a directory in bytes."""
-        return sum(f.stat().st_size for f in path.glob('**/*') if f.is_file())
+        """Calculate the total size of a directory in bytes.
+        
+        Uses os.scandir so file type checks come from the directory listing
+        instead of a separate stat per entry.
+        """
+        total = 0
+        stack = [str(path)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                total += entry.stat(follow_symlinks=False).st_size
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+        return total
     
     def _is_profile_directory(self, path: Path) -> bool:
         """Check if a directory is a valid Chrome profile directory."""
@@ -504,7 +618,7 @@ class ProfileManager:
         self.profiles.clear()
         profiles_path = Path(self.user_data_dir)
         
-        logger.debug(f"Starting profile discovery in: {profiles_path}")
+        logger.debug("Starting profile discovery in: %s", profiles_path)
         
         if not profiles_path.exists():
             error_msg = f"Chrome user data directory not found: {profiles_path}"
@@ -515,52 +629,64 @@ class ProfileManager:
         try:
             # List all items in the directory for debugging
             dir_contents = list(profiles_path.iterdir())
-            logger.debug(f"Found {len(dir_contents)} items in {profiles_path}")
+            logger.debug("Found %d items in %s", len(dir_contents), profiles_path)
             
             # Find all profile directories
+            profile_dirs = []
             for item in dir_contents:
                 try:
                     # Skip special directories and ignored profiles
                     if item.name in ['.', '..'] or item.name in self.IGNORED_PROFILES:
-                        logger.debug(f"Skipping ignored item: {item.name}")
+                        logger.debug("Skipping ignored item: %s", item.name)
                         continue
                         
-                    logger.debug(f"Checking item: {item.name} (is_dir: {item.is_dir()})")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Checking item: %s (is_dir: %s)", item.name, item.is_dir())
                     
                     # Check if this is a profile directory
                     if self._is_profile_directory(item):
-                        logger.debug(f"Processing profile directory: {item.name}")
-                        try:
-                            profile_info = self._get_profile_info(item)
-                            profile_type = self._get_profile_type(item.name)
-                            profile_info['profile_type'] = profile_type
-                            self.profiles[item.name] = profile_info
-                            
-                            logger.info(f"Found {profile_type} profile: {item.name} "
-                                     f"(display_name: {profile_info.get('display_name', 'N/A')}, "
-                                     f"email: {profile_info.get('email', 'N/A')})")
-                            
-                        except Exception as e:
-                            logger.error(f"Error getting info for profile {item.name}: {str(e)}", exc_info=True)
-                            # Add basic profile info even if we can't get all details
-                            self.profiles[item.name] = {
-                                'name': item.name,
-                                'path': str(item.absolute()),
-                                'profile_type': self._get_profile_type(item.name),
-                                'display_name': item.name,
-                                'size_mb': 0,
-                                'last_modified': 0
-                            }
+                        profile_dirs.append(item)
                     else:
-                        logger.debug(f"Skipping non-profile directory: {item.name}")
+                        logger.debug("Skipping non-profile directory: %s", item.name)
                         
                 except Exception as e:
                     logger.error(f"Unexpected error processing {item.name}: {str(e)}", exc_info=True)
             
+            # Reading a profile is mostly file and SQLite I/O, so profiles are
+            # read in parallel; results are stored in directory order
+            workers = max(1, min(_PROFILE_SCAN_WORKERS, len(profile_dirs)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [(item, executor.submit(self._get_cached_profile_info, item)) for item in profile_dirs]
+                
+                for item, future in futures:
+                    logger.debug("Processing profile directory: %s", item.name)
+                    try:
+                        profile_info = future.result()
+                        # _get_profile_info has already classified the profile
+                        profile_type = profile_info['profile_type']
+                        self.profiles[item.name] = profile_info
+                        
+                        logger.info(f"Found {profile_type} profile: {item.name} "
+                                 f"(display_name: {profile_info.get('display_name', 'N/A')}, "
+                                 f"email: {profile_info.get('email', 'N/A')})")
+                        
+                    except Exception as e:
+                        logger.error(f"Error getting info for profile {item.name}: {str(e)}", exc_info=True)
+                        # Add basic profile info even if we can't get all details
+                        self.profiles[item.name] = {
+                            'name': item.name,
+                            'path': str(item.absolute()),
+                            'profile_type': self._get_profile_type(item.name),
+                            'display_name': item.name,
+                            'size_mb': 0,
+                            'last_modified': 0
+                        }
+            
             # Log summary of found profiles
             logger.info(f"Discovered {len(self.profiles)} profiles in {profiles_path}")
-            for profile_name, profile in self.profiles.items():
-                logger.debug(f"- {profile_name}: {profile}")
+            if logger.isEnabledFor(logging.DEBUG):
+                for profile_name, profile in self.profiles.items():
+                    logger.debug("- %s: %s", profile_name, profile)
                 
         except Exception as e:
             logger.critical(f"Fatal error during profile discovery: {str(e)}", exc_info=True)
@@ -576,17 +702,12 @@ class ProfileManager:
         Returns:
             List of dictionaries containing profile information
         """
-        # Filter profiles by type if specified
-        filtered_profiles = self.profiles.items()
-        if profile_type:
-            filtered_profiles = [
-                (name, profile) for name, profile in filtered_profiles
-                if profile.get('profile_type') == profile_type
-            ]
-        
-        # Prepare the result list
+        # Filter and prepare the result list in a single pass
         result = []
-        for name, profile in filtered_profiles:
+        for name, profile in self.profiles.items():
+            if profile_type and profile.get('profile_type') != profile_type:
+                continue
+            
             # Create a copy of the profile to avoid modifying the original
             profile_info = profile.copy()
             profile_info['name'] = name
@@ -611,7 +732,7 @@ class ProfileManager:
         
         # Sort by profile type and then by display name
         def get_sort_key(p):
-            type_order = {'user': 0, 'development': 1, 'system': 2}.get(p.get('profile_type', 'user'), 3)
+            type_order = _PROFILE_TYPE_ORDER.get(p.get('profile_type', 'user'), 3)
             return (type_order, (p.get('display_name') or p['name']).lower())
         
         return sorted(result, key=get_sort_key)
@@ -676,7 +797,7 @@ class ProfileManager:
     def _get_directory_size_mb(directory: Path) -> float:
         """Calculate the size of a directory in MB."""
         try:
-            total_size = sum(f.stat().st_size for f in directory.glob('**/*') if f.is_file())
+            total_size = ProfileManager._get_directory_size(directory)
             return round(total_size / (1024 * 1024), 2)  # Convert to MB
         except Exception as e:
             logger.warning(f"Could not calculate size for {directory}: {e}")
@@ -712,27 +833,23 @@ def select_profile_interactive(profiles: List[Dict[str, Any]]) -> Optional[Dict[
     # Sort profiles by type (user first, then development, then system)
     def get_profile_sort_key(p):
         profile_type = p.get('profile_type', 'user')
-        type_order = {'user': 0, 'development': 1, 'system': 2}.get(profile_type, 3)
+        type_order = _PROFILE_TYPE_ORDER.get(profile_type, 3)
         return (type_order, p['display_name'].lower())
     
     profiles.sort(key=get_profile_sort_key)
     
-    # Print header
-    print("\n" + "="*80)
-    print(f"{'#':>3}  {'Profile Name':<30} {'Email':<30} {'Size':>10}")
-    print("="*80)
-    
-    # Print each profile
+    # Build the whole table and write it with a single print
+    lines = ["", _RULE, _TABLE_HEADER, _RULE]
     for i, profile in enumerate(profiles, 1):
         profile['_display_index'] = i
         display_name = profile['display_name'][:28] + '..' if len(profile['display_name']) > 30 else profile['display_name']
         email = (profile['email'] or '')[:28] + '..' if profile['email'] and len(profile['email']) > 30 else (profile['email'] or '')
         size = format_size(profile['size_mb'])
         
-        print(f"{i:3d}. {display_name:<30} {email:<30} {size:>10}")
+        lines.append(f"{i:3d}. {display_name:<30} {email:<30} {size:>10}")
     
-    print("\n" + "-"*80)
-    print("Profile Details (select a number to see details or press Enter to cancel):")
+    lines.extend(["", _THIN_RULE, "Profile Details (select a number to see details or press Enter to cancel):"])
+    print("\n".join(lines))
     
     # Main interaction loop
     while True:
@@ -746,28 +863,26 @@ def select_profile_interactive(profiles: List[Dict[str, Any]]) -> Optional[Dict[
                 
             # Handle 'a' to show all profiles with full details
             if choice == 'a':
-                print("\n" + "="*80)
-                print("AVAILABLE PROFILES WITH DETAILS")
-                print("="*80)
-                
+                details = ["", _RULE, "AVAILABLE PROFILES WITH DETAILS", _RULE]
                 for profile in profiles:
-                    print(f"\nProfile: {profile['display_name']} ({profile['name']})")
+                    details.append(f"\nProfile: {profile['display_name']} ({profile['name']})")
                     if profile['email']:
-                        print(f"  Email: {profile['email']}")
-                    print(f"  Path: {profile['path']}")
-                    print(f"  Size: {format_size(profile['size_mb'])}")
-                    print(f"  Type: {profile.get('profile_type', 'user').title()}")
+                        details.append(f"  Email: {profile['email']}")
+                    details.append(f"  Path: {profile['path']}")
+                    details.append(f"  Size: {format_size(profile['size_mb'])}")
+                    details.append(f"  Type: {profile.get('profile_type', 'user').title()}")
                 
-                print("\n" + "-"*80)
+                details.extend(["", _THIN_RULE])
+                print("\n".join(details))
                 continue
                 
             # Handle numeric selection
             profile_index = int(choice) - 1
             if 0 <= profile_index < len(profiles):
                 selected = profiles[profile_index]
-                print("\n" + "="*80)
+                print(f"\n{_RULE}")
                 print(f"SELECTED PROFILE: {selected['display_name']}")
-                print("="*80)
+                print(_RULE)
                 print(f"Name:    {selected['display_name']} ({selected['name']})")
                 if selected['email']:
                     print(f"Email:   {selected['email']}")
@@ -23,7 +23,7 @@ class ProfileManager:
     """
     
     # Profiles to ignore when discovering
-    IGNORED_PROFILES = ["System Profile", "Guest Profile"]
+    IGNORED_PROFILES = frozenset({"System Profile", "Guest Profile"})
     
     # Default profile names for different browsers
     DEFAULT_PROFILE_NAMES = {
@@ -67,23 +67,24 @@ class ProfileManager:
         """
         browser = (browser or 'chrome').lower()
         
-        # Map of browser names to their default paths
+        # Map of browser names to their default path resolvers; only the
+        # requested browser's path is computed
         browser_paths = {
-            'chrome': cls._get_chrome_user_data_dir(),
-            'chrome-beta': cls._get_chrome_user_data_dir('Chrome Beta'),
-            'chrome-dev': cls._get_chrome_user_data_dir('Chrome Dev'),
-            'chrome-canary': cls._get_chrome_user_data_dir('Chrome SxS'),
-            'chromium': cls._get_chrome_user_data_dir('Chromium'),
-            'edge': cls._get_edge_user_data_dir(),
-            'brave': cls._get_brave_user_data_dir(),
-            'opera': cls._get_opera_user_data_dir(),
-            'vivaldi': cls._get_vivaldi_user_data_dir(),
+            'chrome': lambda: cls._get_chrome_user_data_dir(),
+            'chrome-beta': lambda: cls._get_chrome_user_data_dir('Chrome Beta'),
+            'chrome-dev': lambda: cls._get_chrome_user_data_dir('Chrome Dev'),
+            'chrome-canary': lambda: cls._get_chrome_user_data_dir('Chrome SxS'),
+            'chromium': lambda: cls._get_chrome_user_data_dir('Chromium'),
+            'edge': cls._get_edge_user_data_dir,
+            'brave': cls._get_brave_user_data_dir,
+            'opera': cls._get_opera_user_data_dir,
+            'vivaldi': cls._get_vivaldi_user_data_dir,
         }
         
         if browser not in browser_paths:
             raise ValueError(f"Unsupported browser: {browser}")
             
-        return browser_paths[browser]
+        return browser_paths[browser]()
     
     @staticmethod
     def _get_chrome_user_data_dir(browser_name: str = 'Google/Chrome') -> Path:
@@ -1,8 +1,21 @@
 """Chrome browser configuration."""
+from dataclasses import fields
 from typing import Any, Dict, List, Optional, Tuple, Union
 from pathlib import Path
 from .base import BrowserConfig
 
+# Keyword arguments accepted by the BrowserConfig dataclass __init__
+_BROWSER_FIELDS = frozenset(f.name for f in fields(BrowserConfig))
+
+# Chrome-only keyword arguments; they are read in ChromeConfig.__init__ and
+# must not reach the dataclass __init__, which rejects unknown names
+_CHROME_OPTIONS = frozenset((
+    'chrome_binary', 'chrome_driver_path', 'extensions', 'prefs',
+    'user_data_dir', 'disable_dev_shm_usage', 'no_sandbox', 'disable_gpu',
+    'disable_extensions', 'incognito', 'page_load_strategy',
+    'blocked_url_patterns', 'debugger_address', 'connection_pool_size',
+))
+
 class ChromeConfig(BrowserConfig):
     """Chrome-specific browser configuration."""
     
@@ -16,8 +29,14 @@ class ChromeConfig(BrowserConfig):
         chrome_arguments = kwargs.pop('chrome_arguments', None)
         arguments = kwargs.pop('arguments', [])
         
-        # Initialize parent class first with remaining kwargs
-        super().__init__(**kwargs)
+        unknown = kwargs.keys() - _BROWSER_FIELDS - _CHROME_OPTIONS
+        if unknown:
+            raise TypeError(
+                f"ChromeConfig got unexpected keyword arguments: {', '.join(sorted(unknown))}"
+            )
+        
+        # Initialize parent class first with the arguments it declares
+        super().__init__(**{k: v for k, v in kwargs.items() if k in _BROWSER_FIELDS})
         
         # Chrome-specific configurations
         self.chrome_binary: Optional[str] = kwargs.get('chrome_binary')
@@ -45,6 +64,16 @@ class ChromeConfig(BrowserConfig):
         self.disable_gpu: bool = kwargs.get('disable_gpu', False)
         self.disable_extensions: bool = kwargs.get('disable_extensions', False)
         self.incognito: bool = kwargs.get('incognito', False)
+        self.blocked_url_patterns: List[str] = kwargs.get('blocked_url_patterns', [])
+        # host:port of an already running Chrome (started with
+        # --remote-debugging-port) to attach to instead of launching a new one
+        self.debugger_address: Optional[str] = kwargs.get('debugger_address')
+        # Max keep-alive connections to chromedriver; the urllib3 default of 1
+        # serializes commands issued from several threads
+        self.connection_pool_size: int = kwargs.get('connection_pool_size', 20)
+        # 'normal' waits for every subresource on get(); 'eager' returns at
+        # DOMContentLoaded, enough for flows that wait on specific elements
+        self.page_load_strategy: str = kwargs.get('page_load_strategy', 'normal')
         
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary.
@@ -70,5 +99,9 @@ class ChromeConfig(BrowserConfig):
             'disable_gpu': self.disable_gpu,
             'disable_extensions': self.disable_extensions,
             'incognito': self.incognito,
+            'blocked_url_patterns': self.blocked_url_patterns,
+            'debugger_address': self.debugger_address,
+            'connection_pool_size': self.connection_pool_size,
+            'page_load_strategy': self.page_load_strategy,
         })
         return config
@@ -5,14 +5,30 @@ This module provides the main entry point for Chrome Puppet operations,
 handling the coordination between different components.
 """
 import logging
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar, Union
 
-from .drivers.chrome import ChromeBrowser
-from .config import ChromeConfig, DEFAULT_CONFIG
+from .browser.drivers.chrome import ChromeBrowser
+from .config import ChromeConfig
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
+
+@dataclass
+class BatchResult:
+    """Outcome of a single task run by run_batch."""
+    item: Any
+    success: bool
+    value: Any = None
+    error: Optional[str] = None
+    duration_ms: float = 0.0
+
 
 class ChromePuppetOrchestrator:
     """Orchestrates Chrome Puppet operations."""
@@ -23,7 +39,7 @@ class ChromePuppetOrchestrator:
         Args:
             config: Configuration for Chrome Puppet. Uses defaults if None.
         """
-        self.config = config or DEFAULT_CONFIG
+        self.config = config or ChromeConfig()
         self.browser: Optional[ChromeBrowser] = None
 
     def start_browser(self) -> None:
@@ -150,3 +166,59 @@ def create_orchestrator(config: Optional[Union[Dict[str, Any], ChromeConfig]] =
         return ChromePuppetOrchestrator(config)
         
     raise ValueError("config must be a dict or ChromeConfig instance")
+
+
+def run_batch(
+    browsers: Sequence[ChromeBrowser],
+    items: Sequence[T],
+    task: Callable[[ChromeBrowser, T], Any]
+) -> List[BatchResult]:
+    """Run a task for each item across a pool of already-started browsers.
+    
+    Each worker checks a browser out of a queue, runs ``task(browser, item)``
+    and returns it, so no browser is ever driven by two threads at once.
+    Failures are reported per item rather than raised, so one bad item does
+    not abort the rest of the batch.
+    
+    Args:
+        browsers: Started browser instances to spread the work across
+        items: Items to process, one task call per item
+        task: Callable taking a browser and an item
+        
+    Returns:
+        List of BatchResult objects in the same order as ``items``
+        
+    Raises:
+        ValueError: If no browsers are provided
+    """
+    if not browsers:
+        raise ValueError("run_batch requires at least one browser")
+    
+    pool: "queue.Queue[ChromeBrowser]" = queue.Queue()
+    for browser in browsers:
+        pool.put(browser)
+    
+    def _worker(item: T) -> BatchResult:
+        browser = pool.get()
+        start = time.perf_counter()
+        try:
+            value = task(browser, item)
+            return BatchResult(
+                item=item,
+                success=True,
+                value=value,
+                duration_ms=(time.perf_counter() - start) * 1000
+            )
+        except Exception as e:
+            logger.warning(f"Batch task failed for {item!r}: {e}")
+            return BatchResult(
+                item=item,
+                success=False,
+                error=str(e),
+                duration_ms=(time.perf_counter() - start) * 1000
+            )
+        finally:
+            pool.put(browser)
+    
+    with ThreadPoolExecutor(max_workers=len(browsers)) as executor:
+        return list(executor.map(_worker, items))
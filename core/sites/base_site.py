@@ -5,13 +5,71 @@ This module provides an abstract base class that defines the interface for
 site-specific handlers. Each website or web portal should implement its own
 handler by subclassing BaseSiteHandler.
 """
+import gzip
+import logging
+import os
+import pickle
+import time
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Deque, Tuple
 from pathlib import Path
 
-from ..browser.chrome import ChromeBrowser
+from ..browser.drivers.chrome import ChromeBrowser
 from ..config import ChromeConfig
 
+logger = logging.getLogger(__name__)
+
+# Happy-path diagnostic checkpoints are opt-in; failures always capture
+DIAG = os.environ.get("CHROME_PUPPET_DIAG", "0") == "1"
+
+# Number of checkpoint HTML snapshots kept in memory for the next failure
+HTML_RING_SIZE = 4
+
+# Clicks the first element matching any of the given CSS selectors or,
+# failing that, the first displayed button whose whole trimmed text matches
+# the given pattern, in a single round trip; returns whether anything was
+# clicked. The pattern is anchored so "Agree" does not match "Disagree". The
+# text scan stops at the first hit rather than evaluating an XPath
+# contains() over the whole document
+_CLICK_FIRST_SCRIPT = (
+    "for (var i = 0; i < arguments[0].length; i++) {"
+    "  var el = document.querySelector(arguments[0][i]);"
+    "  if (el) { el.click(); return true; }"
+    "}"
+    "if (!arguments[1]) { return false; }"
+    "var re = new RegExp('^(?:' + arguments[1] + ')$', 'i');"
+    "var buttons = document.querySelectorAll('button, [role=button]');"
+    "for (var j = 0; j < buttons.length; j++) {"
+    "  var b = buttons[j];"
+    "  if (b.offsetParent === null && getComputedStyle(b).position !== 'fixed') { continue; }"
+    "  if (re.test(b.textContent.trim())) { b.click(); return true; }"
+    "}"
+    "return false;"
+)
+
+# Diagnostic files are written off the caller's thread so failure handling
+# (and any retry that follows) does not wait on disk I/O
+_DIAG_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix='diagnostics')
+
+
+def _write_diagnostics(
+    data_dir: Path,
+    tag: str,
+    html: str,
+    png: bytes,
+    snapshots: List[Tuple[str, float, bytes]]
+) -> None:
+    """Write captured diagnostics to disk (runs on the writer thread)."""
+    try:
+        for snap_tag, captured_at, data in snapshots:
+            (data_dir / f'{snap_tag}_{int(captured_at)}.html.gz').write_bytes(data)
+        (data_dir / f'{tag}.html').write_text(html, encoding='utf-8')
+        (data_dir / f'{tag}.png').write_bytes(png)
+    except Exception as e:
+        logger.warning(f"Could not write diagnostics for {tag}: {e}")
+
 
 class BaseSiteHandler(ABC):
     """Abstract base class for site-specific handlers.
@@ -19,18 +77,28 @@ class BaseSiteHandler(ABC):
     This class defines the interface that all site handlers must implement.
     """
     
+    # CSS selectors of cookie-consent buttons to dismiss, tried in order
+    CONSENT_SELECTORS: Tuple[str, ...] = ()
+    # JavaScript regex (case-insensitive) matched against the whole trimmed
+    # text of displayed buttons when no selector matches, e.g. "Accept|Got it"
+    CONSENT_BUTTON_TEXT: Optional[str] = None
+    
     def __init__(self, 
                  config: Optional[ChromeConfig] = None, 
                  data_dir: Optional[Path] = None):
         """Initialize the site handler.
         
         Args:
-            config: Chrome configuration to use. If None, uses default config.
+            config: Chrome configuration to use. If None, uses default config with
+                the eager page-load strategy.
             data_dir: Directory to store site-specific data (cookies, cache, etc.)
         """
-        self.config = config or ChromeConfig()
+        # Site flows wait on specific elements, so navigation need not block
+        # on images and third-party scripts
+        self.config = config or ChromeConfig(page_load_strategy='eager')
         self.data_dir = data_dir or Path.cwd() / 'data' / self.get_site_name()
         self.browser: Optional[ChromeBrowser] = None
+        self._html_ring: Deque[Tuple[str, float, bytes]] = deque(maxlen=HTML_RING_SIZE)
         self._setup_data_dir()
     
     @abstractmethod
@@ -83,12 +151,66 @@ class BaseSiteHandler(ABC):
         if self.browser and self.browser.is_running():
             self.browser.stop()
     
+    def dismiss_consent(self) -> bool:
+        """Click the site's cookie-consent button if one is on the page.
+        
+        All of ``CONSENT_SELECTORS`` are probed in one script call rather
+        than waiting on each selector in turn, followed by a scan of button
+        text against ``CONSENT_BUTTON_TEXT`` if it is set, so a page without
+        a banner costs a single round trip.
+        
+        Returns:
+            bool: True if a consent button was clicked
+        """
+        if not (self.CONSENT_SELECTORS or self.CONSENT_BUTTON_TEXT):
+            return False
+        if not self.browser or not self.browser.is_running():
+            return False
+        try:
+            return bool(self.browser.driver.execute_script(
+                _CLICK_FIRST_SCRIPT, list(self.CONSENT_SELECTORS), self.CONSENT_BUTTON_TEXT
+            ))
+        except Exception as e:
+            logger.debug(f"Could not dismiss consent banner: {e}")
+            return False
+    
+    def capture_diagnostics(self, tag: str, force: bool = False) -> None:
+        """Capture the page HTML (and a screenshot on failure) for debugging.
+        
+        Checkpoints on the happy path are no-ops unless the
+        CHROME_PUPPET_DIAG environment variable is set, and even then their
+        HTML is only kept compressed in memory. Error handlers pass
+        ``force=True``, which captures the current HTML and a screenshot and
+        writes them, along with the buffered checkpoints, to the data
+        directory on a background thread.
+        
+        Args:
+            tag: Base file name for the captured files
+            force: Capture even when diagnostics are disabled
+        """
+        if not (DIAG or force):
+            return
+        if not self.browser or not self.browser.is_running():
+            return
+        try:
+            html = self.browser.driver.page_source
+            if not force:
+                self._html_ring.append((tag, time.time(), gzip.compress(html.encode('utf-8'))))
+                return
+            png = self.browser.take_screenshot()
+            snapshots = list(self._html_ring)
+            self._html_ring.clear()
+            _DIAG_WRITER.submit(_write_diagnostics, self.data_dir, tag, html, png, snapshots)
+        except Exception as e:
+            logger.warning(f"Could not capture diagnostics for {tag}: {e}")
+    
     def save_cookies(self, filename: str = 'cookies.pkl') -> Path:
         """Save browser cookies to a file."""
         if not self.browser:
             raise RuntimeError("Browser not started")
         cookies_file = self.data_dir / filename
-        self.browser.save_cookies(str(cookies_file))
+        with open(cookies_file, 'wb') as f:
+            pickle.dump(self.browser.get_all_cookies(), f)
         return cookies_file
     
     def load_cookies(self, filename: str = 'cookies.pkl') -> bool:
@@ -97,7 +219,8 @@ class BaseSiteHandler(ABC):
             raise RuntimeError("Browser not started")
         cookies_file = self.data_dir / filename
         if cookies_file.exists():
-            self.browser.load_cookies(str(cookies_file))
+            with open(cookies_file, 'rb') as f:
+                self.browser.add_cookies(pickle.load(f))
             return True
         return False
     
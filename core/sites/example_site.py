@@ -4,19 +4,21 @@ Example implementation of a site handler.
 This module shows how to implement a site handler for a specific website
 by subclassing BaseSiteHandler.
 """
-import time
 from typing import Optional, Dict, Any
 from pathlib import Path
 
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import (
+    JavascriptException,
     NoSuchElementException,
     TimeoutException,
     WebDriverException
 )
 
 from .base_site import BaseSiteHandler
-from ..browser.chrome import ChromeBrowser
+from ..browser.base import DEFAULT_POLL_FREQUENCY
+from ..browser.drivers.chrome import ChromeBrowser
 from ..config import ChromeConfig
 from ..utils import retry_on_exception
 
@@ -30,6 +32,55 @@ class ExampleSiteHandler(BaseSiteHandler):
     
     LOGIN_URL = "https://example.com/login"
     DASHBOARD_URL = "https://example.com/dashboard"
+    # Short wait for the form to appear, longer wait for the login outcome,
+    # so a missing form fails fast and the retry starts sooner
+    FIND_WAIT = 5
+    STATE_WAIT = 15
+    LOGIN_POLL_INTERVAL = DEFAULT_POLL_FREQUENCY
+    
+    # CSS selectors, defined once per class rather than on every call. They
+    # are resolved in the page by querySelector, so subclasses overriding
+    # them must use CSS too
+    USER_MENU = "#user-menu"
+    USERNAME_FIELD = "input[name='username']"
+    PASSWORD_FIELD = "input[name='password']"
+    REMEMBER_ME = "input[name='remember']"
+    SUBMIT_BUTTON = "button[type='submit']"
+    DASHBOARD_USERNAME = ".username"
+    LOGIN_ERROR = ".login-error"
+    
+    CONSENT_SELECTORS = (
+        "#onetrust-accept-btn-handler",
+        ".onetrust-close-btn-handler",
+    )
+    CONSENT_BUTTON_TEXT = "Accept|Got it|Agree"
+    
+    # Resolves several CSS selectors to elements in a single round trip
+    FIND_ALL_SCRIPT = "return arguments[0].map(function(s) { return document.querySelector(s); });"
+    
+    # Fills the login form in one round trip. Values are set through the
+    # native setter and input/change events are dispatched so frameworks
+    # that track field state see the edit
+    FILL_FORM_SCRIPT = (
+        "var setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;"
+        "[[arguments[0], arguments[2]], [arguments[1], arguments[3]]].forEach(function(p) {"
+        "  setter.call(p[0], p[1]);"
+        "  p[0].dispatchEvent(new Event('input', {bubbles: true}));"
+        "  p[0].dispatchEvent(new Event('change', {bubbles: true}));"
+        "});"
+        "if (arguments[4] && !arguments[4].checked) { arguments[4].click(); }"
+    )
+    
+    # Presence check done in the page, so an absent element costs one round
+    # trip regardless of any implicit wait configured on the driver
+    HAS_ELEMENT_SCRIPT = "return document.querySelector(arguments[0]) !== null;"
+    
+    # Reports both the success marker and any error banner in one round trip
+    LOGIN_STATE_PROBE = (
+        "var menu = document.querySelector(arguments[0]);"
+        "var err = document.querySelector(arguments[1]);"
+        "return {logged_in: !!menu, error: err ? err.textContent.trim() : null};"
+    )
     
     def get_site_name(self) -> str:
         return "example_com"
@@ -42,12 +93,8 @@ class ExampleSiteHandler(BaseSiteHandler):
         if not self.browser or not self.browser.is_running():
             return False
             
-        try:
-            # Try to find an element that only exists when logged in
-            self.browser.driver.find_element(By.ID, "user-menu")
-            return True
-        except NoSuchElementException:
-            return False
+        # Look for an element that only exists when logged in
+        return self._has_user_menu(self.browser.driver)
     
     @retry_on_exception(max_retries=2, exceptions=(TimeoutException, WebDriverException))
     def login(self, username: str, password: str, **kwargs) -> bool:
@@ -62,47 +109,100 @@ class ExampleSiteHandler(BaseSiteHandler):
             bool: True if login was successful
         """
         self.start_browser()
-        
+
         try:
-            # Navigate to login page
-            self.browser.navigate_to(self.LOGIN_URL)
+            # Navigate to login page; only the DOM is needed, not every
+            # image and analytics script on it
+            self.browser.get_interactive(self.LOGIN_URL, timeout=self.STATE_WAIT)
+            self.dismiss_consent()
             
-            # Fill in login form
-            username_field = self.browser.driver.find_element(By.NAME, "username")
-            password_field = self.browser.driver.find_element(By.NAME, "password")
+            # Skip the form round trips if the session is already logged in
+            if self.is_logged_in():
+                # Write back a session restored from the profile or refreshed
+                # by the server, so the saved cookies stay current
+                self.save_cookies()
+                return True
             
-            username_field.clear()
-            username_field.send_keys(username)
+            # Look up every form element in one call per poll
+            try:
+                username_field, password_field, remember_me, login_button = WebDriverWait(
+                    self.browser.driver,
+                    self.FIND_WAIT,
+                    poll_frequency=self.LOGIN_POLL_INTERVAL
+                ).until(self._login_form_ready)
+            except TimeoutException:
+                raise NoSuchElementException("Login form elements not found")
             
-            password_field.clear()
-            password_field.send_keys(password)
+            # Fill in login form in one call instead of clear/send_keys per field
+            remember = kwargs.get('remember_me', True)
+            try:
+                self.browser.driver.execute_script(
+                    self.FILL_FORM_SCRIPT, username_field, password_field,
+                    username, password, remember_me if remember else None
+                )
+            except JavascriptException:
+                # Fall back to typing for form variants the script can't drive
+                username_field.clear()
+                username_field.send_keys(username)
+                
+                password_field.clear()
+                password_field.send_keys(password)
+                
+                # Handle remember me checkbox if needed
+                if remember and remember_me is not None:
+                    if not remember_me.is_selected():
+                        remember_me.click()
             
-            # Handle remember me checkbox if needed
-            if kwargs.get('remember_me', True):
-                remember_me = self.browser.driver.find_element(By.NAME, "remember")
-                if not remember_me.is_selected():
-                    remember_me.click()
+            self.capture_diagnostics('login_form')
             
             # Submit the form
-            login_button = self.browser.driver.find_element(By.XPATH, "//button[@type='submit']")
             login_button.click()
             
-            # Wait for login to complete and redirect
-            time.sleep(2)  # Simple wait - in production, use WebDriverWait
+            # Wait for either the logged-in marker or an error banner
+            try:
+                state = WebDriverWait(
+                    self.browser.driver,
+                    self.STATE_WAIT,
+                    poll_frequency=self.LOGIN_POLL_INTERVAL
+                ).until(self._login_settled)
+            except TimeoutException:
+                return False
             
-            # Verify login was successful
-            if self.is_logged_in():
-                # Save cookies for future sessions
-                self.save_cookies()
-                return True
-                
-            return False
+            if state['error']:
+                print(f"Login failed: {state['error']}")
+                return False
+            
+            # Save cookies for future sessions
+            self.save_cookies()
+            return True
             
         except Exception as e:
             print(f"Login failed: {e}")
-            # Take a screenshot for debugging
-            self.browser.take_screenshot(str(self.data_dir / 'login_error.png'))
+            self.capture_diagnostics('login_error', force=True)
+            return False
+    
+    def _login_form_ready(self, driver: Any) -> Any:
+        """WebDriverWait condition returning the form elements once the required ones exist."""
+        selectors = [self.USERNAME_FIELD, self.PASSWORD_FIELD,
+                     self.REMEMBER_ME, self.SUBMIT_BUTTON]
+        elements = driver.execute_script(self.FIND_ALL_SCRIPT, selectors)
+        username_field, password_field, _, login_button = elements
+        if username_field is None or password_field is None or login_button is None:
             return False
+        return elements
+    
+    def _has_user_menu(self, driver: Any) -> bool:
+        """Return whether the logged-in user menu is on the page."""
+        return bool(driver.execute_script(self.HAS_ELEMENT_SCRIPT, self.USER_MENU))
+    
+    def _login_settled(self, driver: Any) -> Any:
+        """WebDriverWait condition returning the login state once it is known."""
+        state = driver.execute_script(
+            self.LOGIN_STATE_PROBE, self.USER_MENU, self.LOGIN_ERROR
+        )
+        if state['logged_in'] or state['error']:
+            return state
+        return False
     
     def logout(self) -> None:
         """Log out of the example.com website."""
@@ -117,8 +217,16 @@ class ExampleSiteHandler(BaseSiteHandler):
             # logout_button = self.browser.driver.find_element(By.LINK_TEXT, "Logout")
             # logout_button.click()
             
-            # Wait for logout to complete
-            time.sleep(1)
+            # Wait for logout to complete; the user menu disappears as soon
+            # as the session is gone, so don't sleep for a fixed second
+            try:
+                WebDriverWait(
+                    self.browser.driver,
+                    self.FIND_WAIT,
+                    poll_frequency=self.LOGIN_POLL_INTERVAL
+                ).until_not(self._has_user_menu)
+            except TimeoutException:
+                print("Logout not confirmed: user menu is still present")
             
             # Delete cookies file if it exists
             cookies_file = self.data_dir / 'cookies.pkl'
@@ -139,7 +247,7 @@ class ExampleSiteHandler(BaseSiteHandler):
         
         # Example: Extract data from the dashboard
         data = {
-            'username': self.browser.driver.find_element(By.CLASS_NAME, 'username').text,
+            'username': self.browser.driver.find_element(By.CSS_SELECTOR, self.DASHBOARD_USERNAME).text,
             'stats': {}
         }
         
@@ -1,8 +1,8 @@
 """System information collection utilities."""
 import platform
 import sys
-import subprocess
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -16,14 +16,7 @@ def get_system_info() -> Dict[str, Any]:
         Dict containing system information
     """
     info = {
-        'os': {
-            'system': platform.system(),
-            'release': platform.release(),
-            'version': platform.version(),
-            'machine': platform.machine(),
-            'processor': platform.processor(),
-            'is_64bit': sys.maxsize > 2**32,
-        },
+        'os': dict(_get_os_info()),
         'python': {
             'version': platform.python_version(),
             'implementation': platform.python_implementation(),
@@ -33,18 +26,40 @@ def get_system_info() -> Dict[str, Any]:
         'chromedriver': {},
     }
     
-    # Get Chrome version
+    chrome_version = _get_chrome_version()
+    if chrome_version:
+        info['chrome']['version'] = chrome_version
+    
+    return info
+
+
+# OS details and the Chrome version don't change while the process runs, so
+# they are looked up once (platform.processor() may spawn a subprocess)
+@lru_cache(maxsize=1)
+def _get_os_info() -> Dict[str, Any]:
+    """Collect operating system details."""
+    return {
+        'system': platform.system(),
+        'release': platform.release(),
+        'version': platform.version(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'is_64bit': sys.maxsize > 2**32,
+    }
+
+
+@lru_cache(maxsize=1)
+def _get_chrome_version() -> Optional[str]:
+    """Get the installed Chrome version, or None if it can't be determined."""
     try:
         if platform.system() == 'Windows':
-            cmd = r'reg query "HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon" /v version'
-            result = subprocess.run(cmd, capture_output=True, text=True, shell=True, check=False)
-            if result.returncode == 0:
-                version = result.stdout.strip().split()[-1]
-                info['chrome']['version'] = version
+            # Read the registry in-process instead of spawning 'reg query'
+            import winreg
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r'Software\Google\Chrome\BLBeacon') as key:
+                return winreg.QueryValueEx(key, 'version')[0]
     except Exception as e:
         logger.warning(f"Could not determine Chrome version: {e}")
-    
-    return info
+    return None
 
 def log_system_info() -> None:
     """Log system information at the beginning of the session."""
@@ -112,7 +112,8 @@ def retry_with_timeout(
                             f"({timeout - elapsed:.1f}s remaining)"
                         )
                     
-                    time.sleep(check_interval)
+                    # Never sleep past the deadline just to fail afterwards
+                    time.sleep(min(check_interval, timeout - elapsed))
             
             # If we get here, we timed out
             raise TimeoutError(
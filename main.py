@@ -11,18 +11,26 @@ Usage:
 Examples:
     python main.py https://www.google.com
     python main.py https://www.example.com --headless --timeout 10 --screenshot
+    python main.py --urls-file urls.txt --headless --screenshot
 """
 import argparse
 import logging
 import re
 import sys
-import time
-from typing import Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Optional, Tuple
 from urllib.parse import urlparse
 
-from core.browser import Browser, ChromeBrowser
-from core.config import ChromeConfig
-from core.browser.exceptions import BrowserError, NavigationError
+from utils import setup_logger
+
+# The browser stack (Selenium and friends) is imported inside main() once the
+# arguments and URL are validated, so --help and the URL prompt start quickly
+if TYPE_CHECKING:
+    from core.browser import ChromeBrowser
+
+# Checked on every URL the user enters
+_URL_PREFIXES = ('http://', 'https://')
+_VALID_SCHEMES = frozenset(('http', 'https'))
 
 
 def is_valid_url(url: str) -> bool:
@@ -36,7 +44,7 @@ def is_valid_url(url: str) -> bool:
     """
     try:
         result = urlparse(url)
-        return all([result.scheme in ('http', 'https'), result.netloc])
+        return result.scheme in _VALID_SCHEMES and bool(result.netloc)
     except (ValueError, AttributeError):
         return False
 
@@ -61,7 +69,7 @@ def prompt_for_url() -> str:
             return default_url
             
         # Add https:// if no scheme is provided
-        if not user_input.startswith(('http://', 'https://')):
+        if not user_input.startswith(_URL_PREFIXES):
             user_input = f'https://{user_input}'
             
         if is_valid_url(user_input):
@@ -69,15 +77,10 @@ def prompt_for_url() -> str:
             
         print("Invalid URL. Please try again (e.g., example.com or https://example.com)")
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('browser_automation.log')
-    ]
-)
+# Configure logging on the root logger. setup_logger writes the log file
+# through its own queue listener, so logging calls never wait on disk I/O
+_LOG_FILE = 'browser_automation.log'
+setup_logger('', log_file=_LOG_FILE)
 logger = logging.getLogger(__name__)
 
 
@@ -97,6 +100,12 @@ def parse_arguments() -> argparse.Namespace:
         default=None,
         help='URL to load (prompt if not provided)'
     )
+    parser.add_argument(
+        '--urls-file',
+        type=str,
+        default=None,
+        help='File with one URL per line to load in a single browser session'
+    )
     parser.add_argument(
         '--headless',
         action='store_true',
@@ -150,6 +159,67 @@ def parse_window_size(size_str: str) -> Tuple[int, int]:
         return 1200, 800
 
 
+def read_urls_file(path: str) -> List[str]:
+    """Read the URLs to load from a file.
+    
+    Blank lines and lines starting with '#' are ignored, and invalid URLs
+    are skipped with a warning.
+    
+    Args:
+        path: Path to a file containing one URL per line
+        
+    Returns:
+        List of valid URLs in file order
+    """
+    urls = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            url = line.strip()
+            if not url or url.startswith('#'):
+                continue
+            if not url.startswith(_URL_PREFIXES):
+                url = f'https://{url}'
+            if is_valid_url(url):
+                urls.append(url)
+            else:
+                logger.warning(f"Skipping invalid URL: {url}")
+    return urls
+
+
+def load_url(browser: 'ChromeBrowser', url: str) -> None:
+    """Load a URL, restarting the browser if its session has gone away.
+    
+    Args:
+        browser: Running browser instance shared across URLs
+        url: The URL to load
+    """
+    from selenium.common.exceptions import InvalidSessionIdException
+    
+    logger.info(f"Navigating to {url}...")
+    try:
+        browser.driver.get(url)
+    except InvalidSessionIdException:
+        logger.warning("Browser session was lost, restarting browser...")
+        browser.stop()
+        browser.start()
+        browser.driver.get(url)
+    logger.info(f"Current URL: {browser.driver.current_url}")
+
+
+def write_screenshot(path: str, png: bytes) -> None:
+    """Write captured screenshot bytes to disk (runs on the writer thread).
+    
+    Args:
+        path: Destination file
+        png: PNG image data
+    """
+    try:
+        with open(path, 'wb') as f:
+            f.write(png)
+    except OSError as e:
+        logger.error(f"Could not save screenshot {path}: {e}")
+
+
 def main() -> int:
     """Main entry point for the script.
     
@@ -158,16 +228,34 @@ def main() -> int:
     """
     args = parse_arguments()
     
+    # A URL file loads every URL in one browser session instead of paying
+    # a Chrome start-up per URL
+    if args.urls_file:
+        try:
+            urls = read_urls_file(args.urls_file)
+        except OSError as e:
+            print(f"Error: could not read URL file '{args.urls_file}': {e}")
+            return 1
+        if not urls:
+            print(f"Error: no valid URLs found in '{args.urls_file}'")
+            return 1
     # If no URL provided as argument, prompt the user
-    if args.url is None:
+    elif args.url is None:
         args.url = prompt_for_url()
     # Validate the provided URL
     elif not is_valid_url(args.url):
         print(f"Warning: '{args.url}' is not a valid URL. Defaulting to Google.")
         args.url = 'https://www.google.com'
     
+    if not args.urls_file:
+        urls = [args.url]
+    
     if args.verbose:
-        logging.getLogger().setLevel(logging.DEBUG)
+        setup_logger('', log_level=logging.DEBUG, log_file=_LOG_FILE)
+    
+    from core.browser import ChromeBrowser
+    from core.config import ChromeConfig
+    from core.browser.exceptions import BrowserError, NavigationError
     
     try:
         # Parse window size
@@ -186,27 +274,34 @@ def main() -> int:
         logger.info(f"Initializing Chrome browser (headless={args.headless})...")
         browser = ChromeBrowser(config=config)
         
+        # Screenshots are written in the background so the next URL starts
+        # loading while the previous image goes to disk
+        screenshot_writer = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix='screenshots')
+            if args.screenshot else None
+        )
+        
         try:
             # Start the browser
             logger.info("Starting browser...")
             browser.start()
             
-            # Navigate to the URL
-            logger.info(f"Navigating to {args.url}...")
-            browser.driver.get(args.url)
-            
-            # Get page information
-            current_url = browser.driver.current_url
-            logger.info(f"Current URL: {current_url}")
-            
-            if args.screenshot:
-                screenshot_file = 'screenshot.png'
-                logger.info(f"Taking screenshot: {screenshot_file}")
-                browser.driver.save_screenshot(screenshot_file)
+            for index, url in enumerate(urls, 1):
+                load_url(browser, url)
+                
+                if args.screenshot:
+                    screenshot_file = (
+                        'screenshot.png' if len(urls) == 1 else f'screenshot_{index}.png'
+                    )
+                    logger.info(f"Taking screenshot: {screenshot_file}")
+                    png = browser.driver.get_screenshot_as_png()
+                    screenshot_writer.submit(write_screenshot, screenshot_file, png)
             
-            # Keep the browser open for the specified duration
+            # Keep the browser open for the specified duration, or until the
+            # user closes the window
             logger.info(f"Browser will close in {args.timeout} seconds...")
-            time.sleep(args.timeout)
+            if browser.wait_for_window_close(args.timeout):
+                logger.info("Browser window was closed")
             
         except NavigationError as e:
             logger.error(f"Navigation failed: {e}")
@@ -218,6 +313,8 @@ def main() -> int:
             # Ensure browser is always closed properly
             logger.info("Closing browser...")
             browser.stop()
+            if screenshot_writer is not None:
+                screenshot_writer.shutdown(wait=True)
             
     except BrowserError as e:
         logger.error(f"Browser initialization failed: {e}")
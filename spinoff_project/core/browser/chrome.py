@@ -11,7 +11,6 @@ from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.chrome.webdriver import WebDriver as ChromeWebDriver
 from selenium.webdriver.remote.webelement import WebElement
-from webdriver_manager.chrome import ChromeDriverManager
 
 from core.browser import Browser
 from core.config import ChromeConfig
@@ -39,22 +38,24 @@ class ChromeBrowser(Browser):
             # Try to use the installed ChromeDriver first
             self._driver = webdriver.Chrome(
                 service=ChromeService(),
-                options=chrome_options
+                options=chrome_options,
+                keep_alive=True
             )
         except WebDriverException as e:
             logger.warning("Failed to use installed ChromeDriver, falling back to webdriver-manager: %s", e)
-            # Fall back to webdriver-manager if ChromeDriver not found
+            # Fall back to webdriver-manager if ChromeDriver not found; it is
+            # only imported here since it pulls in requests and friends
+            from webdriver_manager.chrome import ChromeDriverManager
             self._driver = webdriver.Chrome(
                 service=ChromeService(ChromeDriverManager().install()),
-                options=chrome_options
+                options=chrome_options,
+                keep_alive=True
             )
         
         # Configure timeouts
         self._driver.set_page_load_timeout(self.config.page_load_timeout)
         self._driver.set_script_timeout(self.config.script_timeout)
-        
-        if self.config.implicit_wait > 0:
-            self._driver.implicitly_wait(self.config.implicit_wait)
+        # No implicit wait: lookups wait explicitly with WebDriverWait
     
     def _create_chrome_options(self) -> ChromeOptions:
         """Create ChromeOptions based on the configuration."""
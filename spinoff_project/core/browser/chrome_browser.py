@@ -26,7 +26,6 @@ from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.remote.shadowroot import ShadowRoot
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
 
 from core.browser import BaseBrowser, BrowserError, NavigationError
 from core.config import ChromeConfig
@@ -65,20 +64,21 @@ class ChromeBrowser(BaseBrowser):
             
             try:
                 # First try with the default ChromeDriver
-                self._driver = webdriver.Chrome(service=self._service, options=options)
+                self._driver = webdriver.Chrome(service=self._service, options=options, keep_alive=True)
             except WebDriverException as e:
                 self._logger.warning("Falling back to webdriver-manager: %s", e)
-                # Fall back to webdriver-manager if ChromeDriver not found
+                # Fall back to webdriver-manager if ChromeDriver not found; it
+                # is only imported here since it pulls in requests and friends
+                from webdriver_manager.chrome import ChromeDriverManager
                 self._service = ChromeService(ChromeDriverManager().install())
-                self._driver = webdriver.Chrome(service=self._service, options=options)
+                self._driver = webdriver.Chrome(service=self._service, options=options, keep_alive=True)
             
             # Configure timeouts
             self._driver.set_page_load_timeout(self.config.page_load_timeout)
             self._driver.set_script_timeout(self.config.script_timeout)
             
-            if self.config.implicit_wait > 0:
-                self._driver.implicitly_wait(self.config.implicit_wait)
-                
+            # No implicit wait: lookups wait explicitly with WebDriverWait
+            
             self._logger.info("Chrome browser started successfully")
             
         except Exception as e:
@@ -173,11 +173,12 @@ class ChromeBrowser(BaseBrowser):
         Raises:
             TimeoutException: If the element is not found within the timeout
         """
-        return WebDriverWait(
+        wait = WebDriverWait(
             self.driver,
             timeout=timeout,
             poll_frequency=poll_frequency
-        ).until(EC.presence_of_element_located((by, value)))
+        )
+        return wait.until(EC.presence_of_element_located((by, value)))
     
     def take_screenshot(self, file_path: str, full_page: bool = False) -> bool:
         """Take a screenshot of the current page.
@@ -203,12 +204,15 @@ class ChromeBrowser(BaseBrowser):
     def _take_full_page_screenshot(self, file_path: str) -> bool:
         """Take a screenshot of the full page by scrolling and stitching."""
         try:
-            # Store original size
-            original_size = self.driver.get_window_size()
+            # Get the window's outer size (what get_window_size() reports)
+            # and the page dimensions in a single round trip
+            width, height, total_width, total_height = self.driver.execute_script(
+                "return [window.outerWidth, window.outerHeight,"
+                " document.body.scrollWidth, document.body.scrollHeight];"
+            )
             
-            # Get page dimensions
-            total_width = self.driver.execute_script("return document.body.scrollWidth")
-            total_height = self.driver.execute_script("return document.body.scrollHeight")
+            # Store original size
+            original_size = {'width': width, 'height': height}
             
             # Set viewport size
             self.driver.set_window_size(total_width, total_height)
@@ -17,15 +17,14 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
 
 # Import config first to avoid circular imports
-from core.config import ChromeConfig, DEFAULT_CONFIG
-from core.browser.driver_config import DriverConfig
+from core.config import ChromeConfig, DriverConfig
 
 # Lazy import for ChromeDriver to avoid circular imports
 ChromeDriver = None
 def get_chrome_driver():
     global ChromeDriver
     if ChromeDriver is None:
-        from core.browser.drivers.chrome_driver import ChromeDriver as CD
+        from core.browser.drivers.chrome import ChromeBrowser as CD
         ChromeDriver = CD
     return ChromeDriver
 
@@ -50,7 +49,7 @@ def chrome_config() -> ChromeConfig:
         headless=True,  # Run in headless mode for CI
         window_size=(1280, 1024),
         implicit_wait=10,
-        chrome_args=[
+        chrome_arguments=[
             '--disable-notifications',
             '--disable-infobars',
             '--disable-gpu',
@@ -71,6 +70,21 @@ def browser(chrome_config: ChromeConfig) -> ChromeDriver:
     yield browser
     browser.stop()
 
+@pytest.fixture
+def fake_driver(monkeypatch):
+    """Patch ChromeBrowser.start() to use a mock WebDriver instead of Chrome.
+
+    Returns the mock driver that any browser started in the test receives.
+    """
+    from unittest import mock
+    from core.browser.drivers.chrome import browser as browser_module
+
+    driver = mock.MagicMock(name='webdriver')
+    factory = mock.MagicMock(name='ChromeServiceFactory')
+    monkeypatch.setattr(browser_module, 'ChromeWebDriver', mock.MagicMock(return_value=driver))
+    monkeypatch.setattr(browser_module, 'ChromeServiceFactory', factory)
+    return driver
+
 @pytest.fixture
 def test_page_url() -> str:
     """Return the URL to a test page."""
@@ -0,0 +1,293 @@
+"""Tests for ChromeBrowser methods, driven by a mock WebDriver."""
+from unittest import mock
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from core.config import ChromeConfig
+from core.browser.exceptions import BrowserError, NavigationError, ScreenshotError
+from core.browser.drivers.chrome import ChromeBrowser
+from core.browser.drivers.chrome import browser as browser_module
+
+
+@pytest.fixture
+def started(fake_driver):
+    """A ChromeBrowser started on the mock WebDriver."""
+    return ChromeBrowser(ChromeConfig(implicit_wait=10)).start()
+
+
+def test_start_leaves_the_implicit_wait_at_zero(started, fake_driver):
+    """Explicit waits are the only waits; config.implicit_wait is not applied."""
+    fake_driver.implicitly_wait.assert_not_called()
+
+
+def test_wait_for_element_is_an_explicit_wait(started, fake_driver):
+    """wait_for_element polls and returns the element once it appears."""
+    element = mock.MagicMock(name='element')
+    fake_driver.find_element.return_value = element
+
+    assert started.wait_for_element('id', 'ready', timeout=1) is element
+    fake_driver.implicitly_wait.assert_not_called()
+
+
+def test_wait_for_url_matches(started, fake_driver):
+    """The wait returns once the URL matches the pattern."""
+    type(fake_driver).current_url = mock.PropertyMock(side_effect=[
+        'https://example.com/login',
+        'https://example.com/login',
+        'https://example.com/dashboard?tab=1',
+    ])
+
+    with mock.patch.object(browser_module, 'DEFAULT_POLL_FREQUENCY', 0.01):
+        assert started.wait_for_url_matches(r'/dashboard\b', timeout=1) is True
+
+
+def test_wait_for_url_matches_times_out(started, fake_driver):
+    """A URL that never matches ends the wait with False."""
+    type(fake_driver).current_url = mock.PropertyMock(return_value='https://example.com/login')
+
+    assert started.wait_for_url_matches(r'/dashboard\b', timeout=0.05) is False
+
+
+def test_wait_for_url_matches_literal_pattern(started, fake_driver):
+    """A pattern without metacharacters is matched as a plain substring."""
+    type(fake_driver).current_url = mock.PropertyMock(return_value='https://example.com/account')
+
+    with mock.patch.object(browser_module.re, 'compile') as compile_:
+        assert started.wait_for_url_matches('/account', timeout=1) is True
+    compile_.assert_not_called()
+
+
+def test_block_urls_defaults(started, fake_driver):
+    """Without patterns the default analytics/font/image list is blocked."""
+    started.block_urls()
+
+    fake_driver.execute_cdp_cmd.assert_called_with(
+        "Network.setBlockedURLs", {"urls": list(browser_module.DEFAULT_BLOCKED_URL_PATTERNS)}
+    )
+
+
+def test_block_urls_skips_unchanged_patterns(started, fake_driver):
+    """Re-applying the patterns in effect costs no CDP round trip."""
+    started.block_urls(['*.png'])
+    fake_driver.execute_cdp_cmd.reset_mock()
+
+    started.block_urls(['*.png'])
+    fake_driver.execute_cdp_cmd.assert_not_called()
+
+    started.block_urls([])
+    fake_driver.execute_cdp_cmd.assert_called_with("Network.setBlockedURLs", {"urls": []})
+
+
+def test_block_urls_enables_the_network_domain_once(started, fake_driver):
+    """Changing the block list later is a single CDP command."""
+    started.block_urls(['*.png'])
+    started.block_urls(['*.gif'])
+
+    assert [c.args[0] for c in fake_driver.execute_cdp_cmd.call_args_list] == [
+        "Network.enable", "Network.setBlockedURLs", "Network.setBlockedURLs",
+    ]
+
+
+def test_element_screenshot_highlight_is_one_round_trip_each_way(started, fake_driver):
+    """The old style is read while the highlight is applied, then restored."""
+    element = mock.MagicMock(name='element')
+    element.screenshot_as_png = b'png'
+    fake_driver.execute_script.return_value = 'color: blue;'
+
+    assert started.take_element_screenshot(element, highlight=True) == b'png'
+
+    calls = fake_driver.execute_script.call_args_list
+    assert len(calls) == 2
+    assert calls[0].args[1:] == (element, browser_module.ELEMENT_HIGHLIGHT_STYLE)
+    assert calls[1].args[1:] == (element, 'color: blue;')
+    element.get_attribute.assert_not_called()
+
+
+def test_element_screenshot_without_highlight(started, fake_driver):
+    """A plain element capture runs no scripts."""
+    element = mock.MagicMock(name='element')
+    element.screenshot_as_png = b'png'
+
+    assert started.take_element_screenshot(element) == b'png'
+    fake_driver.execute_script.assert_not_called()
+
+
+def test_screenshot_saved_as_bytes(started, fake_driver, tmp_path):
+    """Page and element captures share one binary writer."""
+    fake_driver.get_screenshot_as_png.return_value = b'page'
+    element = mock.MagicMock(name='element')
+    element.screenshot_as_png = b'element'
+
+    assert started.take_screenshot(str(tmp_path / 'page.png')) == str(tmp_path / 'page.png')
+    started.take_element_screenshot(element, str(tmp_path / 'element.png'))
+
+    assert (tmp_path / 'page.png').read_bytes() == b'page'
+    assert (tmp_path / 'element.png').read_bytes() == b'element'
+
+
+def test_screenshot_write_failure_raises_screenshot_error(started, fake_driver, tmp_path):
+    """An unwritable destination is reported as a ScreenshotError."""
+    fake_driver.get_screenshot_as_png.return_value = b'page'
+
+    with pytest.raises(ScreenshotError):
+        started.take_screenshot(str(tmp_path))
+
+
+def test_screenshot_directory_created_once(started, fake_driver, tmp_path):
+    """The target directory is created on first use and not re-checked after."""
+    fake_driver.get_screenshot_as_png.return_value = b'page'
+    shots = tmp_path / 'shots'
+
+    with mock.patch.object(browser_module.os, 'makedirs', wraps=browser_module.os.makedirs) as makedirs:
+        started.take_screenshot(str(shots / 'one.png'))
+        started.take_screenshot(str(shots / 'two.png'))
+
+    makedirs.assert_called_once_with(str(shots), exist_ok=True)
+    assert (shots / 'two.png').read_bytes() == b'page'
+
+
+def test_set_local_storage_in_one_call(started, fake_driver):
+    """Every entry is written by a single script call."""
+    started.set_local_storage({'theme': 'dark', 'lang': 'en'}, clear=True)
+
+    fake_driver.execute_script.assert_called_once()
+    assert fake_driver.execute_script.call_args.args[1:] == ({'theme': 'dark', 'lang': 'en'}, True)
+
+
+def test_set_local_storage_with_nothing_to_do(started, fake_driver):
+    """No entries and no clear means no round trip."""
+    started.set_local_storage({})
+    fake_driver.execute_script.assert_not_called()
+
+
+def test_wait_for_window_close(started, fake_driver):
+    """The wait ends as soon as no window handles remain."""
+    type(fake_driver).window_handles = mock.PropertyMock(side_effect=[['main'], []])
+
+    real_wait = browser_module.WebDriverWait
+    fast_wait = lambda driver, timeout, poll_frequency: real_wait(driver, timeout, poll_frequency=0.01)
+
+    with mock.patch.object(browser_module, 'WebDriverWait', fast_wait):
+        assert started.wait_for_window_close(timeout=1) is True
+
+
+def test_wait_for_window_close_when_session_ends(started, fake_driver):
+    """Losing the session because the last window closed counts as closed."""
+    type(fake_driver).window_handles = mock.PropertyMock(side_effect=WebDriverException('no session'))
+
+    assert started.wait_for_window_close(timeout=1) is True
+
+
+def test_wait_for_window_close_times_out(started, fake_driver):
+    """An open window at the deadline yields False."""
+    type(fake_driver).window_handles = mock.PropertyMock(return_value=['main'])
+
+    assert started.wait_for_window_close(timeout=0.05) is False
+
+
+def navigation(fake_driver, start_url, ready):
+    """Answer the navigation scripts: the start URL, then each ready state in turn."""
+    states = iter(ready)
+
+    def execute_script(script, *args):
+        if script == browser_module._START_NAVIGATION_SCRIPT:
+            return start_url
+        return next(states)
+    fake_driver.execute_script.side_effect = execute_script
+
+
+def test_get_interactive_returns_once_the_dom_is_ready(started, fake_driver):
+    """Navigation starts by script and returns when the selector is present."""
+    navigation(fake_driver, 'https://example.com/', [None, False, True])
+    started._config.page_load_strategy = 'none'
+
+    with mock.patch.object(browser_module, 'DEFAULT_POLL_FREQUENCY', 0.01):
+        started.get_interactive('https://example.com/login', '#username', timeout=1)
+
+    calls = fake_driver.execute_script.call_args_list
+    url, token = calls[0].args[1:]
+    assert (calls[0].args[0], url) == (browser_module._START_NAVIGATION_SCRIPT, 'https://example.com/login')
+    assert calls[-1].args == (browser_module._DOM_READY_SCRIPT, '#username', token)
+    assert len(calls) == 4
+    fake_driver.get.assert_not_called()
+
+
+def test_get_interactive_stops_when_the_document_is_kept(started, fake_driver):
+    """A navigation that leaves the document in place (204, download) is not waited out."""
+    navigation(fake_driver, 'https://example.com/', [None])
+
+    started.get_interactive('https://example.com/report.csv', timeout=5)
+
+    assert fake_driver.execute_script.call_count == 2
+
+
+def test_get_interactive_hash_only_keeps_the_document(started, fake_driver):
+    """A fragment-only navigation does not wait for a new document."""
+    navigation(fake_driver, 'https://example.com/docs#intro', [True])
+    started._config.page_load_strategy = 'none'
+
+    started.get_interactive('#usage', '#usage', timeout=5)
+
+    calls = fake_driver.execute_script.call_args_list
+    assert len(calls) == 2
+    assert calls[-1].args == (browser_module._DOM_READY_SCRIPT, '#usage', None)
+
+
+def test_get_interactive_times_out_as_navigation_error(started, fake_driver):
+    """A page that never becomes ready raises NavigationError."""
+    fake_driver.execute_script.return_value = False
+
+    with pytest.raises(NavigationError):
+        started.get_interactive('https://example.com/slow', timeout=0.05)
+
+
+def test_page_contains_searches_in_the_browser(started, fake_driver):
+    """Only the boolean result crosses the wire, not the page source."""
+    fake_driver.execute_script.return_value = True
+    page_source = mock.PropertyMock(return_value='<html>Welcome back</html>')
+    type(fake_driver).page_source = page_source
+
+    assert started.page_contains('Welcome back') is True
+    fake_driver.execute_script.assert_called_once_with(
+        browser_module._PAGE_CONTAINS_SCRIPT, 'Welcome back'
+    )
+    page_source.assert_not_called()
+
+
+def test_page_contains_false(started, fake_driver):
+    """A falsy script result is reported as False."""
+    fake_driver.execute_script.return_value = None
+
+    assert started.page_contains('missing') is False
+
+
+def test_add_cookies_in_one_cdp_command(started, fake_driver):
+    """All cookies go out in one Network.setCookies call with CDP field names."""
+    type(fake_driver).current_url = mock.PropertyMock(return_value='https://example.com/')
+
+    started.add_cookies([
+        {'name': 'sid', 'value': '1', 'domain': '.example.com', 'expiry': 1700000000,
+         'httpOnly': True},
+        {'name': 'theme', 'value': 'dark', 'path': '/'},
+    ])
+
+    fake_driver.execute_cdp_cmd.assert_called_once_with("Network.setCookies", {"cookies": [
+        {'name': 'sid', 'value': '1', 'domain': '.example.com', 'httpOnly': True,
+         'expires': 1700000000},
+        {'name': 'theme', 'value': 'dark', 'url': 'https://example.com/', 'path': '/'},
+    ]})
+    fake_driver.add_cookie.assert_not_called()
+
+
+def test_add_cookies_rejects_malformed_cookies(started, fake_driver):
+    """A cookie without a name is reported as a BrowserError."""
+    with pytest.raises(BrowserError):
+        started.add_cookies([{'value': '1'}])
+    fake_driver.execute_cdp_cmd.assert_not_called()
+
+
+def test_add_cookies_with_nothing_to_add(started, fake_driver):
+    """An empty list costs no round trip."""
+    started.add_cookies([])
+    fake_driver.execute_cdp_cmd.assert_not_called()
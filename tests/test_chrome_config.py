@@ -0,0 +1,99 @@
+"""Tests for ChromeConfig options and how they reach the Chrome options."""
+from unittest import mock
+
+import pytest
+
+from core.config import ChromeConfig
+from core.browser.drivers.chrome import ChromeBrowser
+from core.browser.drivers.chrome import options as options_module
+from core.browser.drivers.chrome.options import ChromeOptionsBuilder
+
+
+def test_unknown_option_is_rejected():
+    """Typos still fail loudly instead of being silently ignored."""
+    with pytest.raises(TypeError):
+        ChromeConfig(page_load_stratgy='eager')
+
+
+def test_page_load_strategy_defaults_to_normal():
+    """Existing callers keep the full-load behaviour."""
+    assert ChromeConfig().page_load_strategy == 'normal'
+
+
+def test_page_load_strategy_option():
+    """The strategy can be set at construction and is applied to the options."""
+    config = ChromeConfig(page_load_strategy='eager', headless=True)
+
+    assert config.page_load_strategy == 'eager'
+    assert config.headless is True
+    assert config.to_dict()['page_load_strategy'] == 'eager'
+    assert ChromeOptionsBuilder(config).build().page_load_strategy == 'eager'
+
+
+def test_invalid_page_load_strategy_is_rejected():
+    """Only the strategies WebDriver understands are accepted."""
+    with pytest.raises(ValueError):
+        ChromeOptionsBuilder(ChromeConfig(page_load_strategy='fast'))
+
+
+def test_blocked_url_patterns_option(fake_driver):
+    """Patterns given at construction are blocked as soon as the browser starts."""
+    config = ChromeConfig(blocked_url_patterns=['*.png', '*hotjar.com*'])
+    assert config.to_dict()['blocked_url_patterns'] == ['*.png', '*hotjar.com*']
+
+    ChromeBrowser(config).start()
+
+    fake_driver.execute_cdp_cmd.assert_has_calls([
+        mock.call("Network.enable", {}),
+        mock.call("Network.setBlockedURLs", {"urls": ['*.png', '*hotjar.com*']}),
+    ])
+
+
+def test_no_urls_blocked_by_default(fake_driver):
+    """Without the option start() leaves network requests alone."""
+    ChromeBrowser(ChromeConfig()).start()
+
+    fake_driver.execute_cdp_cmd.assert_not_called()
+
+
+def test_debugger_address_option():
+    """A debugger address makes Chrome attach to an existing instance."""
+    config = ChromeConfig(debugger_address='127.0.0.1:9222')
+
+    assert config.to_dict()['debugger_address'] == '127.0.0.1:9222'
+    options = ChromeOptionsBuilder(config).build()
+    assert options.experimental_options['debuggerAddress'] == '127.0.0.1:9222'
+
+
+def test_no_debugger_address_by_default():
+    """Without the option a new Chrome is launched."""
+    options = ChromeOptionsBuilder(ChromeConfig()).build()
+    assert 'debuggerAddress' not in options.experimental_options
+
+
+def test_connection_pool_size_option(fake_driver):
+    """The configured size is applied to the chromedriver connection pool."""
+    config = ChromeConfig(connection_pool_size=4)
+    assert config.to_dict()['connection_pool_size'] == 4
+
+    ChromeBrowser(config).start()
+
+    pool_manager = fake_driver.command_executor._conn
+    pool_manager.connection_pool_kw.__setitem__.assert_called_with('maxsize', 4)
+    pool_manager.clear.assert_called_once()
+
+
+def test_connection_pool_size_defaults_to_20():
+    """Existing callers keep the default pool size."""
+    assert ChromeConfig().connection_pool_size == 20
+
+
+def test_browser_logging_off_by_default(monkeypatch):
+    """Chrome log collection is disabled unless debug logs are requested."""
+    monkeypatch.setattr(options_module, 'DEBUG_LOGS', False)
+    options = ChromeOptionsBuilder(ChromeConfig()).build()
+    assert options.to_capabilities()['goog:loggingPrefs']['browser'] == 'OFF'
+
+    monkeypatch.setattr(options_module, 'DEBUG_LOGS', True)
+    options = ChromeOptionsBuilder(ChromeConfig()).build()
+    assert 'goog:loggingPrefs' not in options.to_capabilities()
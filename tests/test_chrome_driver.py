@@ -15,8 +15,8 @@ from core.browser.exceptions import (
     NavigationError
 )
 from core.config import ChromeConfig
-from core.browser.drivers.chrome_driver import ChromeDriver
-from core.browser.driver_config import DriverConfig
+from core.browser.drivers.chrome import ChromeBrowser as ChromeDriver
+from core.config import DriverConfig
 
 # Mark all tests in this module as browser tests
 pytestmark = [pytest.mark.browser, pytest.mark.driver]
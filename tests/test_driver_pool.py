@@ -0,0 +1,105 @@
+"""Tests for the opt-in browser pool behind create_driver/release_driver."""
+from unittest import mock
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+import core.browser.drivers.chrome as chrome
+from core.browser.exceptions import BrowserError
+from core.config import ChromeConfig
+
+
+class FakeBrowser:
+    """Stand-in for a started ChromeBrowser."""
+
+    def __init__(self, config=None):
+        self._config = config
+        self.driver = mock.MagicMock(name='driver')
+        self.running = True
+        self.stop_calls = 0
+
+    def is_running(self):
+        return self.running
+
+    def stop(self):
+        self.stop_calls += 1
+        self.running = False
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    """Enable reuse with fake browsers and leave an empty pool behind."""
+    monkeypatch.setattr(chrome, 'REUSE_DRIVER', True)
+    monkeypatch.setattr(chrome, 'ChromeBrowser', FakeBrowser)
+    chrome._driver_pool.clear()
+    yield chrome._driver_pool
+    chrome._driver_pool.clear()
+
+
+def test_released_browser_is_reused(pool):
+    """A released browser is reset and handed to the next caller with that config."""
+    config = ChromeConfig(headless=True)
+    first = chrome.create_driver(config)
+    chrome.release_driver(first)
+
+    first.driver.delete_all_cookies.assert_called_once()
+    first.driver.get.assert_called_once_with('about:blank')
+    assert chrome.create_driver(config) is first
+    assert first.stop_calls == 0
+
+
+def test_pool_is_keyed_by_config(pool):
+    """A browser is only reused for an identical configuration."""
+    first = chrome.create_driver(ChromeConfig(headless=True))
+    chrome.release_driver(first)
+
+    assert chrome.create_driver(ChromeConfig(headless=False)) is not first
+
+
+def test_dead_pooled_browser_is_replaced(pool):
+    """A browser whose session died while idle is discarded, even if stop() fails."""
+    config = ChromeConfig()
+    dead = chrome.create_driver(config)
+    chrome.release_driver(dead)
+    type(dead.driver).current_url = mock.PropertyMock(side_effect=WebDriverException('gone'))
+    dead.stop = mock.Mock(side_effect=BrowserError('already gone'))
+
+    fresh = chrome.create_driver(config)
+
+    assert fresh is not dead
+    dead.stop.assert_called_once()
+
+
+def test_failed_reset_stops_instead_of_pooling(pool):
+    """A browser that cannot be reset is stopped rather than reused."""
+    browser = chrome.create_driver()
+    browser.driver.delete_all_cookies.side_effect = WebDriverException('crashed')
+
+    chrome.release_driver(browser)
+
+    assert browser.stop_calls == 1
+    assert not any(pool.values())
+
+
+def test_drain_stops_idle_browsers(pool):
+    """Idle browsers are stopped at exit; one failing stop does not skip the rest."""
+    first, second = chrome.create_driver(), chrome.create_driver()
+    chrome.release_driver(first)
+    chrome.release_driver(second)
+    first.stop = mock.Mock(side_effect=BrowserError('boom'))
+
+    chrome._drain_pool()
+
+    first.stop.assert_called_once()
+    assert second.stop_calls == 1
+    assert not pool
+
+
+def test_release_without_reuse_stops(monkeypatch):
+    """With reuse off, release just stops the browser."""
+    monkeypatch.setattr(chrome, 'REUSE_DRIVER', False)
+    browser = FakeBrowser()
+
+    chrome.release_driver(browser)
+
+    assert browser.stop_calls == 1
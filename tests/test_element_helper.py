@@ -0,0 +1,160 @@
+"""Tests for ElementHelper, driven by a mock browser."""
+from unittest import mock
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from core.browser.exceptions import ElementNotFoundError, TimeoutError as BrowserTimeoutError
+from core.browser.features import ElementHelper
+
+
+@pytest.fixture
+def driver():
+    """A mock WebDriver."""
+    return mock.MagicMock(name='driver')
+
+
+@pytest.fixture
+def helper(driver):
+    """An ElementHelper bound to the mock driver."""
+    return ElementHelper(mock.Mock(driver=driver, _logger=None))
+
+
+def test_click_locates_the_element_once(helper, driver):
+    """A waited click uses the element the wait returned."""
+    button = mock.MagicMock(name='button')
+    driver.execute_script.return_value = button
+
+    helper.click(By.CSS_SELECTOR, '#save', timeout=1)
+
+    button.click.assert_called_once()
+    assert driver.execute_script.call_count == 1
+    driver.find_element.assert_not_called()
+
+
+def test_send_keys_uses_a_given_element_as_is(helper, driver):
+    """An element passed in is not looked up again."""
+    field = mock.MagicMock(name='field')
+
+    helper.send_keys('hello', element=field)
+
+    field.clear.assert_called_once()
+    field.send_keys.assert_called_once_with('hello')
+    driver.find_element.assert_not_called()
+
+
+def test_get_text_without_timeout_finds_once(helper, driver):
+    """Without a timeout the element is found with a single lookup."""
+    driver.find_element.return_value.text = 'Total: 3'
+
+    assert helper.get_text(By.ID, 'total') == 'Total: 3'
+    driver.find_element.assert_called_once_with(By.ID, 'total')
+
+
+def test_find_element_waits_explicitly(helper, driver):
+    """A timed lookup polls with an explicit wait and never touches the implicit wait."""
+    found = mock.MagicMock(name='found')
+    driver.find_element.side_effect = [NoSuchElementException(), found]
+
+    with mock.patch('core.browser.features.element.helper.DEFAULT_POLL_FREQUENCY', 0.01):
+        assert helper.find_element(By.ID, 'late', timeout=1) is found
+
+    assert driver.find_element.call_count == 2
+    driver.implicitly_wait.assert_not_called()
+
+
+def test_find_element_times_out_as_not_found(helper, driver):
+    """An element that never appears raises ElementNotFoundError."""
+    driver.find_element.side_effect = NoSuchElementException()
+
+    with pytest.raises(ElementNotFoundError):
+        helper.find_element(By.ID, 'missing', timeout=0.05)
+
+
+def test_set_checked_reconciles_in_one_call(helper, driver):
+    """All checkbox states go to the page in a single script call."""
+    driver.execute_script.return_value = ['#missing']
+
+    assert helper.set_checked({'#terms': True, '#missing': False}) == ['#missing']
+    assert driver.execute_script.call_count == 1
+    assert driver.execute_script.call_args[0][2] == {'#terms': True, '#missing': False}
+
+
+def test_set_checked_with_nothing_to_do(helper, driver):
+    """An empty mapping skips the round trip."""
+    assert helper.set_checked({}) == []
+    driver.execute_script.assert_not_called()
+
+
+def test_set_value_sets_the_whole_string(helper, driver):
+    """The value is set in one script call instead of typed key by key."""
+    field = mock.MagicMock(name='field')
+    driver.execute_script.return_value = True
+
+    assert helper.set_value('alice@example.com', element=field) is True
+    driver.execute_script.assert_called_once()
+    assert driver.execute_script.call_args[0][1:] == (field, 'alice@example.com')
+    field.send_keys.assert_not_called()
+
+
+def test_set_value_reports_an_unchanged_field(helper, driver):
+    """A field that already holds the value is left alone."""
+    driver.execute_script.return_value = False
+
+    assert helper.set_value('same', element=mock.MagicMock()) is False
+
+
+def test_clickable_check_is_one_script_per_poll(helper, driver):
+    """ID and CSS locators are checked in the page, polling until clickable."""
+    button = mock.MagicMock(name='button')
+    driver.execute_script.side_effect = [None, button]
+
+    with mock.patch('core.browser.features.element.helper.DEFAULT_POLL_FREQUENCY', 0.01):
+        assert helper.wait_for_element_clickable(By.ID, 'save', timeout=1) is button
+
+    assert driver.execute_script.call_count == 2
+    assert driver.execute_script.call_args[0][1:] == (True, 'save')
+    driver.find_element.assert_not_called()
+
+
+def test_clickable_check_times_out(helper, driver):
+    """An element that never becomes clickable raises the browser TimeoutError."""
+    driver.execute_script.return_value = None
+
+    with pytest.raises(BrowserTimeoutError):
+        helper.wait_for_element_clickable(By.CSS_SELECTOR, '#save', timeout=0.05)
+
+
+def test_select_options_in_one_call(helper, driver):
+    """Several options are picked with one script call and misses are reported."""
+    select = mock.MagicMock(name='select')
+    driver.execute_script.return_value = ['Mars']
+
+    assert helper.select_options(['Red', 'Mars'], element=select) == ['Mars']
+    driver.execute_script.assert_called_once()
+    assert driver.execute_script.call_args[0][1:] == (select, ['Red', 'Mars'])
+
+
+def test_is_displayed_trusts_the_visibility_wait(helper, driver):
+    """A waited check does not ask the element for its visibility again."""
+    banner = mock.MagicMock(name='banner')
+    banner.is_displayed.return_value = True
+    driver.find_element.return_value = banner
+
+    assert helper.is_displayed(By.ID, 'banner', timeout=1) is True
+    assert banner.is_displayed.call_count == 1
+
+
+def test_is_displayed_immediate_check_uses_find_elements(helper, driver):
+    """An absent element is reported from an empty list, not an exception."""
+    driver.find_elements.return_value = []
+
+    assert helper.is_displayed(By.ID, 'banner') is False
+    driver.find_elements.assert_called_once_with(By.ID, 'banner')
+    driver.find_element.assert_not_called()
+
+    shown = mock.MagicMock(name='shown')
+    shown.is_displayed.return_value = True
+    driver.find_elements.return_value = [shown]
+    assert helper.is_displayed(By.ID, 'banner') is True
@@ -0,0 +1,56 @@
+"""Tests for ElementWaitMixin.wait_for_selector, driven by a mock WebDriver."""
+from unittest import mock
+
+import pytest
+from selenium.common.exceptions import JavascriptException
+from selenium.webdriver.common.by import By
+
+from core.browser.exceptions import TimeoutError as BrowserTimeoutError
+from core.browser.features.element import ElementWaitMixin
+
+
+class Host(ElementWaitMixin):
+    """Minimal host for the mixin."""
+
+    def __init__(self, driver):
+        self.driver = driver
+
+
+@pytest.fixture
+def driver():
+    """A mock WebDriver with the default 30 s script timeout."""
+    driver = mock.MagicMock(name='driver')
+    driver.timeouts.script = 30
+    return driver
+
+
+def test_script_timeout_covers_the_wait(driver):
+    """The async script may run for the whole wait, then the timeout is restored."""
+    element = mock.MagicMock(name='element')
+    driver.execute_async_script.return_value = element
+
+    assert Host(driver).wait_for_selector('#ready', timeout=60) is element
+
+    assert [c.args[0] for c in driver.set_script_timeout.call_args_list] == [61, 30]
+    assert driver.execute_async_script.call_args.args[1:] == ('#ready', True, 60000)
+
+
+def test_no_match_raises_timeout(driver):
+    """The script reporting no match is a timeout, and the timeout is still restored."""
+    driver.execute_async_script.return_value = None
+
+    with pytest.raises(BrowserTimeoutError):
+        Host(driver).wait_for_selector('#ready', timeout=1)
+    driver.set_script_timeout.assert_called_with(30)
+
+
+def test_falls_back_to_polling_with_css_locator(driver):
+    """A script that cannot run falls back to a polling wait on the CSS selector."""
+    driver.execute_async_script.side_effect = JavascriptException('navigated')
+    host = Host(driver)
+
+    with mock.patch.object(host, 'wait_for_element') as wait_for_element:
+        host.wait_for_selector('#ready', timeout=5, visible=False)
+
+    assert wait_for_element.call_args.args == (By.CSS_SELECTOR, '#ready')
+    driver.set_script_timeout.assert_called_with(30)
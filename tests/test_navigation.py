@@ -0,0 +1,43 @@
+"""Tests for NavigationMixin, driven by a mock WebDriver."""
+from unittest import mock
+
+import pytest
+
+from core.browser.features import NavigationMixin
+
+
+class Page(NavigationMixin):
+    """Minimal host for the mixin."""
+
+    def __init__(self, driver):
+        super().__init__()
+        self.driver = driver
+
+
+@pytest.fixture
+def driver():
+    """A mock WebDriver whose pages are always loaded."""
+    driver = mock.MagicMock(name='driver')
+    driver.execute_script.return_value = 'complete'
+    return driver
+
+
+def test_navigate_to_reads_current_url_once(driver):
+    """The previous URL costs a single current_url round trip."""
+    current_url = mock.PropertyMock(return_value='https://example.com/a')
+    type(driver).current_url = current_url
+    page = Page(driver)
+
+    assert page.navigate_to('https://example.com/b') is True
+
+    assert current_url.call_count == 1
+    assert page._last_url == 'https://example.com/a'
+    driver.get.assert_called_once_with('https://example.com/b')
+
+
+def test_title_wait_is_case_insensitive(driver):
+    """The expected text matches the title regardless of case."""
+    type(driver).title = mock.PropertyMock(side_effect=['Loading', 'Welcome, ALICE'])
+
+    with mock.patch('core.browser.features.navigation.mixin.DEFAULT_POLL_FREQUENCY', 0.01):
+        assert Page(driver).wait_for_page_title_contains('Alice', timeout=1) is True
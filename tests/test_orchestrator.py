@@ -0,0 +1,80 @@
+"""Tests for the batch helpers in core.orchestrator."""
+import threading
+import time
+
+import pytest
+
+from core.orchestrator import BatchResult, run_batch
+
+
+class FakeBrowser:
+    """Stand-in for a started ChromeBrowser that records concurrent use."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        return self
+
+    def __exit__(self, *exc):
+        with self._lock:
+            self.active -= 1
+
+
+def test_run_batch_returns_results_in_item_order():
+    """Results line up with the input items regardless of completion order."""
+    browsers = [FakeBrowser('a'), FakeBrowser('b')]
+
+    def task(browser, item):
+        time.sleep(0.01 * (5 - item))
+        return item * 2
+
+    results = run_batch(browsers, list(range(5)), task)
+
+    assert [r.item for r in results] == list(range(5))
+    assert [r.value for r in results] == [0, 2, 4, 6, 8]
+    assert all(r.success for r in results)
+
+
+def test_run_batch_never_shares_a_browser_between_threads():
+    """Each browser is checked out by one worker at a time."""
+    browsers = [FakeBrowser('a'), FakeBrowser('b'), FakeBrowser('c')]
+
+    def task(browser, item):
+        with browser:
+            time.sleep(0.01)
+        return browser.name
+
+    results = run_batch(browsers, list(range(12)), task)
+
+    assert {r.value for r in results} <= {'a', 'b', 'c'}
+    assert all(b.max_active == 1 for b in browsers)
+
+
+def test_run_batch_requires_a_browser():
+    """An empty browser pool is rejected up front."""
+    with pytest.raises(ValueError):
+        run_batch([], [1, 2], lambda browser, item: item)
+
+
+def test_run_batch_reports_failures_per_item():
+    """A failing item yields an unsuccessful BatchResult instead of raising."""
+    def task(browser, item):
+        if item == 'bad':
+            raise RuntimeError('boom')
+        return item.upper()
+
+    results = run_batch([FakeBrowser('a')], ['ok', 'bad', 'fine'], task)
+
+    assert all(isinstance(r, BatchResult) for r in results)
+    assert [r.success for r in results] == [True, False, True]
+    assert results[1].error == 'boom'
+    assert results[1].value is None
+    assert results[2].value == 'FINE'
+    assert all(r.duration_ms >= 0 for r in results)
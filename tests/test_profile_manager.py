@@ -2,12 +2,15 @@ import os
 import sys
 import json
 import logging
+import shutil
+import tempfile
 from pathlib import Path
 from unittest import TestCase, mock
 
 # Add the project root to the Python path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from core.browser import profile_manager
 from core.browser.profile_manager import ProfileManager, ProfileInfo
 
 # Set up logging
@@ -54,6 +57,63 @@ class TestProfileManager(TestCase):
         for name, info in profiles.items():
             logger.info("Profile '%s': %s", name, json.dumps(info, indent=2, default=str))
 
+
+class TestProfileInfoCache(TestCase):
+    """Tests for the profile details cache, on a throwaway user data directory."""
+    
+    def setUp(self):
+        self.user_data_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.user_data_dir)
+        (self.user_data_dir / 'Local State').write_text('{}')
+        self.profile = self.user_data_dir / 'Default'
+        self.profile.mkdir()
+        (self.profile / 'Preferences').write_text('{}')
+        self.write_bookmarks(1)
+        patcher = mock.patch.object(profile_manager, '_profile_info_cache', profile_manager.OrderedDict())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.manager = ProfileManager(self.user_data_dir)
+        
+    def write_bookmarks(self, count):
+        children = [{'type': 'url', 'url': f'https://example.com/{i}'} for i in range(count)]
+        (self.profile / 'Bookmarks').write_text(json.dumps(
+            {'roots': {'bookmark_bar': {'type': 'folder', 'children': children}}}
+        ))
+        
+    def test_unchanged_profile_is_served_from_cache(self):
+        """A second read of an unchanged profile does not re-read its files."""
+        self.manager._get_cached_profile_info(self.profile)
+        with mock.patch.object(self.manager, '_get_profile_info') as get_info:
+            info = self.manager._get_cached_profile_info(self.profile)
+        get_info.assert_not_called()
+        self.assertEqual(info['bookmark_count'], 1)
+        
+    def test_bookmarks_change_invalidates_the_entry(self):
+        """Counts are re-read when Bookmarks changes even if Preferences does not."""
+        self.manager._get_cached_profile_info(self.profile)
+        self.write_bookmarks(3)
+        self.assertEqual(self.manager._get_cached_profile_info(self.profile)['bookmark_count'], 3)
+        
+    def test_size_is_always_fresh(self):
+        """The profile size is recomputed on a cache hit."""
+        before = self.manager._get_cached_profile_info(self.profile)['size_mb']
+        (self.profile / 'Cache').write_bytes(b'x' * 1024 * 1024)
+        after = self.manager._get_cached_profile_info(self.profile)['size_mb']
+        self.assertGreater(after, before)
+        
+    def test_cache_is_bounded(self):
+        """The least recently used profiles are dropped past the cap."""
+        with mock.patch.object(profile_manager, '_PROFILE_INFO_CACHE_SIZE', 2):
+            for name in ('Profile 1', 'Profile 2', 'Profile 3'):
+                path = self.user_data_dir / name
+                path.mkdir()
+                (path / 'Preferences').write_text('{}')
+                self.manager._get_cached_profile_info(path)
+        self.assertEqual(
+            [Path(key).name for key in profile_manager._profile_info_cache],
+            ['Profile 2', 'Profile 3']
+        )
+
 if __name__ == "__main__":
     import unittest
     unittest.main()
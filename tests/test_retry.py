@@ -0,0 +1,33 @@
+"""Tests for the retry decorators in core.utils.retry."""
+import time
+
+import pytest
+
+from core.utils import retry_with_timeout
+
+
+def test_retry_with_timeout_never_sleeps_past_the_deadline():
+    """A long check interval is cut short so the call fails at its timeout."""
+    @retry_with_timeout(timeout=0.2, exceptions=(ValueError,), check_interval=30)
+    def always_fails():
+        raise ValueError('nope')
+
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        always_fails()
+    assert time.monotonic() - start < 5
+
+
+def test_retry_with_timeout_returns_on_success():
+    """The first successful attempt's result is returned."""
+    attempts = []
+
+    @retry_with_timeout(timeout=5, exceptions=(ValueError,), check_interval=0.01)
+    def succeeds_third_time():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ValueError('not yet')
+        return 'done'
+
+    assert succeeds_third_time() == 'done'
+    assert len(attempts) == 3
@@ -0,0 +1,331 @@
+"""Tests for the site handlers, driven by a mock browser."""
+import time
+from unittest import mock
+
+import pytest
+from selenium.common.exceptions import JavascriptException, WebDriverException
+from selenium.webdriver.common.by import By
+
+from core.sites import ExampleSiteHandler, base_site
+
+
+@pytest.fixture
+def handler(tmp_path):
+    """An ExampleSiteHandler whose browser is a running mock."""
+    site = ExampleSiteHandler(data_dir=tmp_path)
+    site.browser = mock.MagicMock(name='browser')
+    site.browser.is_running.return_value = True
+    site.browser.get_all_cookies.return_value = [{'name': 'sid', 'value': '1'}]
+    return site
+
+
+def scripted(driver, responses):
+    """Answer execute_script calls by script, from ``responses``.
+
+    A function value is called with the script arguments to produce the result.
+    """
+    def execute_script(script, *args):
+        value = responses.get(script)
+        return value(*args) if callable(value) else value
+    driver.execute_script.side_effect = execute_script
+
+
+def test_login_short_circuits_after_navigation(handler):
+    """An existing session is detected on the login page, not on about:blank."""
+    driver = handler.browser.driver
+    scripted(driver, {ExampleSiteHandler.HAS_ELEMENT_SCRIPT: True})
+
+    assert handler.login('user', 'secret') is True
+
+    handler.browser.get_interactive.assert_called_once()
+    assert handler.browser.get_interactive.call_args[0][0] == ExampleSiteHandler.LOGIN_URL
+    scripts = [c[0][0] for c in driver.execute_script.call_args_list]
+    assert ExampleSiteHandler.FILL_FORM_SCRIPT not in scripts
+
+
+def test_existing_session_cookies_are_saved(handler):
+    """An already-logged-in session still writes its cookies back."""
+    scripted(handler.browser.driver, {ExampleSiteHandler.HAS_ELEMENT_SCRIPT: True})
+
+    assert handler.login('user', 'secret') is True
+    assert (handler.data_dir / 'cookies.pkl').exists()
+
+
+def test_cookies_round_trip(handler):
+    """Cookies saved after login can be loaded into a later session."""
+    path = handler.save_cookies()
+
+    assert path.exists()
+    assert handler.load_cookies() is True
+    handler.browser.add_cookies.assert_called_once_with([{'name': 'sid', 'value': '1'}])
+
+
+def test_checkpoints_are_skipped_unless_enabled(handler, monkeypatch):
+    """Happy-path captures cost nothing when diagnostics are off."""
+    monkeypatch.setattr(base_site, 'DIAG', False)
+
+    handler.capture_diagnostics('login_form')
+
+    assert not handler._html_ring
+    handler.browser.take_screenshot.assert_not_called()
+
+
+def test_checkpoints_are_buffered_when_enabled(handler, monkeypatch):
+    """With diagnostics on, checkpoints are kept in memory, not written."""
+    monkeypatch.setattr(base_site, 'DIAG', True)
+    handler.browser.driver.page_source = '<html>form</html>'
+
+    handler.capture_diagnostics('login_form')
+
+    assert [tag for tag, _, _ in handler._html_ring] == ['login_form']
+    assert not list(handler.data_dir.glob('*.html*'))
+
+
+def test_dashboard_data_uses_class_locators(handler):
+    """The dashboard lookup goes through the shared locator constant."""
+    scripted(handler.browser.driver, {ExampleSiteHandler.HAS_ELEMENT_SCRIPT: True})
+    handler.browser.driver.find_element.return_value.text = 'alice'
+
+    assert handler.get_dashboard_data()['username'] == 'alice'
+    handler.browser.navigate_to.assert_called_once_with(ExampleSiteHandler.DASHBOARD_URL)
+    handler.browser.driver.find_element.assert_called_once_with(
+        By.CSS_SELECTOR, ExampleSiteHandler.DASHBOARD_USERNAME
+    )
+
+
+def login_form():
+    """Mock username, password, remember-me and submit elements."""
+    return [mock.MagicMock(name=n) for n in ('username', 'password', 'remember', 'submit')]
+
+
+def test_login_waits_for_the_logged_in_marker(handler):
+    """A successful submit is detected by polling, then cookies are saved."""
+    form = login_form()
+    states = iter([
+        {'logged_in': False, 'error': None},
+        {'logged_in': True, 'error': None},
+    ])
+    scripted(handler.browser.driver, {
+        ExampleSiteHandler.HAS_ELEMENT_SCRIPT: False,
+        ExampleSiteHandler.FIND_ALL_SCRIPT: form,
+        ExampleSiteHandler.LOGIN_STATE_PROBE: lambda *args: next(states),
+    })
+    handler.LOGIN_POLL_INTERVAL = 0.01
+
+    assert handler.login('user', 'secret') is True
+    form[3].click.assert_called_once()
+    assert (handler.data_dir / 'cookies.pkl').exists()
+
+
+def test_login_reports_the_error_banner(handler):
+    """An error banner ends the wait at once and the login fails."""
+    scripted(handler.browser.driver, {
+        ExampleSiteHandler.HAS_ELEMENT_SCRIPT: False,
+        ExampleSiteHandler.FIND_ALL_SCRIPT: login_form(),
+        ExampleSiteHandler.LOGIN_STATE_PROBE: {'logged_in': False, 'error': 'Bad password'},
+    })
+
+    assert handler.login('user', 'wrong') is False
+    assert not (handler.data_dir / 'cookies.pkl').exists()
+    probes = [c for c in handler.browser.driver.execute_script.call_args_list
+              if c[0][0] == ExampleSiteHandler.LOGIN_STATE_PROBE]
+    assert len(probes) == 1
+
+
+def test_failure_flushes_buffered_checkpoints(handler, monkeypatch):
+    """A forced capture writes the ring, the page and a screenshot off-thread."""
+    monkeypatch.setattr(base_site, 'DIAG', True)
+    handler.browser.driver.page_source = '<html>page</html>'
+    handler.browser.take_screenshot.return_value = b'png'
+
+    handler.capture_diagnostics('login_form')
+    handler.capture_diagnostics('login_error', force=True)
+    base_site._DIAG_WRITER.submit(lambda: None).result()
+
+    assert (handler.data_dir / 'login_error.html').read_text() == '<html>page</html>'
+    assert (handler.data_dir / 'login_error.png').read_bytes() == b'png'
+    assert len(list(handler.data_dir.glob('login_form_*.html.gz'))) == 1
+    assert not handler._html_ring
+
+
+def test_login_form_is_resolved_in_one_call(handler):
+    """All form elements come from one script; missing required ones keep waiting."""
+    driver = handler.browser.driver
+    form = login_form()
+
+    scripted(driver, {ExampleSiteHandler.FIND_ALL_SCRIPT: form})
+    assert handler._login_form_ready(driver) == form
+    selectors = driver.execute_script.call_args[0][1]
+    assert selectors[0] == "input[name='username']"
+
+    # The remember-me checkbox is optional, the submit button is not
+    scripted(driver, {ExampleSiteHandler.FIND_ALL_SCRIPT: form[:2] + [None, form[3]]})
+    assert handler._login_form_ready(driver)
+    scripted(driver, {ExampleSiteHandler.FIND_ALL_SCRIPT: form[:3] + [None]})
+    assert handler._login_form_ready(driver) is False
+
+
+def test_missing_form_fails_on_the_short_find_budget(handler):
+    """A page without the form fails after FIND_WAIT, not the longer STATE_WAIT."""
+    scripted(handler.browser.driver, {
+        ExampleSiteHandler.HAS_ELEMENT_SCRIPT: False,
+        ExampleSiteHandler.FIND_ALL_SCRIPT: [None, None, None, None],
+    })
+    handler.FIND_WAIT = 0.05
+    handler.STATE_WAIT = 30
+    handler.LOGIN_POLL_INTERVAL = 0.01
+
+    start = time.monotonic()
+    assert handler.login('user', 'secret') is False
+    assert time.monotonic() - start < 5
+
+
+def test_logout_waits_for_the_user_menu_to_go(handler):
+    """Logout returns once the user menu disappears and drops saved cookies."""
+    (handler.data_dir / 'cookies.pkl').write_bytes(b'')
+    present = iter([True, True, False])
+    scripted(handler.browser.driver, {
+        ExampleSiteHandler.HAS_ELEMENT_SCRIPT: lambda *args: next(present),
+    })
+    handler.LOGIN_POLL_INTERVAL = 0.01
+
+    handler.logout()
+
+    handler.browser.navigate_to.assert_called_once_with('https://example.com/logout')
+    assert handler.browser.driver.execute_script.call_count == 3
+    assert not (handler.data_dir / 'cookies.pkl').exists()
+
+
+def test_consent_selectors_are_probed_in_one_call(handler):
+    """Every consent selector goes to the page in a single script call."""
+    scripted(handler.browser.driver, {base_site._CLICK_FIRST_SCRIPT: True})
+
+    assert handler.dismiss_consent() is True
+    handler.browser.driver.execute_script.assert_called_once_with(
+        base_site._CLICK_FIRST_SCRIPT,
+        list(ExampleSiteHandler.CONSENT_SELECTORS),
+        ExampleSiteHandler.CONSENT_BUTTON_TEXT,
+    )
+
+
+def test_consent_probe_failure_is_not_fatal(handler):
+    """A script error while probing is treated as no banner."""
+    handler.browser.driver.execute_script.side_effect = WebDriverException('gone')
+
+    assert handler.dismiss_consent() is False
+
+
+def test_login_form_is_filled_by_script(handler):
+    """The credentials are set in one script call instead of typed per field."""
+    form = login_form()
+    scripted(handler.browser.driver, {
+        ExampleSiteHandler.HAS_ELEMENT_SCRIPT: False,
+        ExampleSiteHandler.FIND_ALL_SCRIPT: form,
+        ExampleSiteHandler.LOGIN_STATE_PROBE: {'logged_in': True, 'error': None},
+    })
+
+    assert handler.login('user', 'secret') is True
+    handler.browser.driver.execute_script.assert_any_call(
+        ExampleSiteHandler.FILL_FORM_SCRIPT, form[0], form[1], 'user', 'secret', form[2]
+    )
+    form[0].send_keys.assert_not_called()
+
+
+def test_login_form_falls_back_to_typing(handler):
+    """Forms the script cannot drive are filled by typing."""
+    form = login_form()
+    form[2].is_selected.return_value = False
+
+    def fill_form(*args):
+        raise JavascriptException('setter blocked')
+
+    scripted(handler.browser.driver, {
+        ExampleSiteHandler.HAS_ELEMENT_SCRIPT: False,
+        ExampleSiteHandler.FIND_ALL_SCRIPT: form,
+        ExampleSiteHandler.FILL_FORM_SCRIPT: fill_form,
+        ExampleSiteHandler.LOGIN_STATE_PROBE: {'logged_in': True, 'error': None},
+    })
+
+    assert handler.login('user', 'secret') is True
+    form[0].send_keys.assert_called_once_with('user')
+    form[1].send_keys.assert_called_once_with('secret')
+    form[2].click.assert_called_once()
+
+
+def test_logged_in_check_is_a_single_script_call(handler):
+    """The user-menu check never goes through find_element and its implicit wait."""
+    scripted(handler.browser.driver, {ExampleSiteHandler.HAS_ELEMENT_SCRIPT: False})
+
+    assert handler.is_logged_in() is False
+    handler.browser.driver.execute_script.assert_called_once_with(
+        ExampleSiteHandler.HAS_ELEMENT_SCRIPT, '#user-menu'
+    )
+    handler.browser.driver.find_element.assert_not_called()
+
+
+def test_overridden_locators_reach_the_page_unchanged(tmp_path):
+    """A subclass's CSS locators are passed to the page as written."""
+    class AvatarSite(ExampleSiteHandler):
+        USER_MENU = "nav .avatar"
+
+    site = AvatarSite(data_dir=tmp_path)
+    site.browser = mock.MagicMock(name='browser')
+    site.browser.driver.execute_script.return_value = True
+
+    assert site.is_logged_in() is True
+    site.browser.driver.execute_script.assert_called_once_with(
+        ExampleSiteHandler.HAS_ELEMENT_SCRIPT, 'nav .avatar'
+    )
+
+
+def test_not_logged_in_without_a_browser(tmp_path):
+    """No browser means no session."""
+    assert ExampleSiteHandler(data_dir=tmp_path).is_logged_in() is False
+
+
+class TextOnlyConsentSite(ExampleSiteHandler):
+    """A site whose consent button is only recognisable by its text."""
+    CONSENT_SELECTORS = ()
+
+
+class NoConsentSite(ExampleSiteHandler):
+    """A site without a consent banner."""
+    CONSENT_SELECTORS = ()
+    CONSENT_BUTTON_TEXT = None
+
+
+def test_consent_button_can_be_matched_by_text_alone(tmp_path):
+    """The button-text pattern is probed even without any selectors."""
+    site = TextOnlyConsentSite(data_dir=tmp_path)
+    site.browser = mock.MagicMock(name='browser')
+    site.browser.driver.execute_script.return_value = True
+
+    assert site.dismiss_consent() is True
+    site.browser.driver.execute_script.assert_called_once_with(
+        base_site._CLICK_FIRST_SCRIPT, [], 'Accept|Got it|Agree'
+    )
+
+
+def test_no_consent_probe_without_selectors_or_text(tmp_path):
+    """Sites without a banner configuration skip the round trip."""
+    site = NoConsentSite(data_dir=tmp_path)
+    site.browser = mock.MagicMock(name='browser')
+
+    assert site.dismiss_consent() is False
+    site.browser.driver.execute_script.assert_not_called()
+
+
+@pytest.mark.browser
+def test_consent_text_skips_disagree_and_hidden_buttons(browser, tmp_path):
+    """Only a displayed button whose whole text matches is clicked."""
+    browser.get(
+        "data:text/html,<div id='clicked'></div>"
+        "<button style='display:none' onclick=\"clicked.textContent='hidden'\">Accept</button>"
+        "<button onclick=\"clicked.textContent='disagree'\">Disagree</button>"
+        "<button onclick=\"clicked.textContent='agree'\"> Agree </button>"
+    )
+    site = TextOnlyConsentSite(data_dir=tmp_path)
+    site.browser = browser
+
+    assert site.dismiss_consent() is True
+    assert browser.driver.find_element('id', 'clicked').text == 'agree'
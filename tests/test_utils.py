@@ -0,0 +1,72 @@
+"""Tests for the helpers in utils.utils."""
+import logging
+import logging.handlers
+from unittest import mock
+
+import pytest
+
+from utils import utils
+
+
+@pytest.fixture
+def logger_name(request):
+    """A logger name unique to the test, torn down afterwards."""
+    name = f"test_utils.{request.node.name}"
+    yield name
+    utils._stop_log_listener(name)
+    logging.getLogger(name).handlers = []
+
+
+def test_setup_logger_writes_through_a_queue_listener(logger_name, tmp_path):
+    """File records are queued and written by the listener thread."""
+    log_file = tmp_path / 'logs' / 'run.log'
+
+    logger = utils.setup_logger(logger_name, log_file=log_file, console=False)
+    logger.info('hello from the queue')
+
+    assert [type(h) for h in logger.handlers] == [logging.handlers.QueueHandler]
+    utils._stop_log_listener(logger_name)
+    assert 'hello from the queue' in log_file.read_text(encoding='utf-8')
+
+
+def test_setup_logger_is_idempotent(logger_name, tmp_path):
+    """Same settings keep the running listener; new settings replace it."""
+    log_file = tmp_path / 'run.log'
+
+    utils.setup_logger(logger_name, log_file=log_file, console=False)
+    listener = utils._log_listeners[logger_name]
+    utils.setup_logger(logger_name, log_file=log_file, console=False)
+    assert utils._log_listeners[logger_name] is listener
+
+    utils.setup_logger(logger_name, log_file=log_file, console=False, log_level=logging.DEBUG)
+    assert utils._log_listeners[logger_name] is not listener
+
+
+def test_retry_backs_off_exponentially_with_jitter():
+    """Delays grow by the backoff factor, are capped, and get up to 0.5 s of jitter."""
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) < 5:
+            raise ConnectionError('try again')
+        return 'ok'
+
+    with mock.patch.object(utils.time, 'sleep') as sleep, \
+            mock.patch.object(utils.random, 'uniform', return_value=0.25) as uniform:
+        assert utils.retry(flaky, max_attempts=5, delay=1.0, backoff=2.0, max_delay=5.0)() == 'ok'
+
+    assert [c.args[0] for c in sleep.call_args_list] == [1.25, 2.25, 4.25, 5.25]
+    uniform.assert_called_with(0, 0.5)
+
+
+def test_retry_reraises_the_last_error():
+    """After the final attempt the original exception propagates, without a last sleep."""
+    func = mock.Mock(side_effect=ValueError('bad'))
+
+    with mock.patch.object(utils.time, 'sleep') as sleep:
+        with pytest.raises(ValueError):
+            utils.retry(func, max_attempts=3, exceptions=(ValueError,))()
+
+    assert func.call_count == 3
+    assert sleep.call_count == 2
@@ -17,7 +17,22 @@ from .utils import (
     setup_logger
 )
 
-from .driver_manager import ChromeDriverManager, ensure_chromedriver_available
+# driver_manager pulls in requests and zipfile handling, so it is only
+# imported when one of its names is first accessed
+_LAZY_EXPORTS = {
+    'ChromeDriverManager': '.driver_manager',
+    'ensure_chromedriver_available': '.driver_manager',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        from importlib import import_module
+        value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'ensure_dir',
@@ -1,18 +1,65 @@
 """
 ChromeDriver management utilities for automatic installation and version management.
 """
+import io
+import json
 import logging
 import os
 import platform
 import re
+import shutil
 import subprocess
 import sys
+import threading
 import zipfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 import requests
+from requests.adapters import HTTPAdapter
 from urllib.parse import urljoin
 
+# Chrome binaries tried on macOS/Linux, in order
+_CHROME_BINARIES = ('google-chrome', 'chromium-browser', 'google-chrome-stable')
+
+# Chrome versions keyed by (binary path, mtime, size) so repeated lookups skip
+# spawning Chrome; an update to the binary changes the key
+_chrome_version_cache: Dict[Tuple[str, int, int], str] = {}
+
+# Full four-part Chrome version, e.g. 136.0.7103.114
+_VERSION_RE = re.compile(r'\d+\.\d+\.\d+\.\d+')
+
+# Read/write block size for driver downloads; the archives are several MB
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Shared HTTP session so version lookups and downloads reuse connections
+_SESSION_POOL_SIZE = 8
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+# File under the driver directory mapping Chrome version -> driver path, so
+# later processes skip resolving the matching driver version over the network
+_RESOLVED_CACHE_FILE = 'resolved.json'
+
+
+def _get_session() -> requests.Session:
+    """Return the module's shared requests session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                # Keep enough idle connections per host for concurrent
+                # managers (e.g. one per worker browser) to share
+                adapter = HTTPAdapter(
+                    pool_connections=_SESSION_POOL_SIZE,
+                    pool_maxsize=_SESSION_POOL_SIZE
+                )
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                _session = session
+    return _session
+
 class ChromeDriverManager:
     """
     Manages ChromeDriver installation and version management.
@@ -39,8 +86,9 @@ class ChromeDriverManager:
             # Chrome for Testing uses 'win32' for 32-bit and 'win64' for 64-bit
             return 'win64' if sys.maxsize > 2**32 else 'win32'
         elif system == 'darwin':
-            # For macOS, check the architecture
-            if platform.processor() == 'arm' or platform.machine() == 'arm64':
+            # For macOS, check the architecture; platform.processor() may
+            # spawn uname, while machine() is already at hand
+            if machine in ('arm64', 'aarch64'):
                 return 'mac-arm64'  # Apple Silicon
             return 'mac-x64'  # Intel
         elif system == 'linux':
@@ -52,20 +100,31 @@ class ChromeDriverManager:
         """Get the installed Chrome/Chromium version."""
         try:
             if platform.system() == 'Windows':
-                # Windows registry approach
-                cmd = 'reg query "HKEY_CURRENT_USER\\Software\\Google\\Chrome\\BLBeacon" /v version'
-                self.logger.debug(f"Running command: {cmd}")
-                result = subprocess.check_output(cmd, shell=True, text=True, stderr=subprocess.PIPE)
-                version = re.search(r'\d+\.\d+\.\d+\.\d+', result)
+                # Windows registry approach, read in-process rather than
+                # spawning 'reg query' through a shell
+                import winreg
+                with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r'Software\Google\Chrome\BLBeacon') as key:
+                    result, _ = winreg.QueryValueEx(key, 'version')
+                version = _VERSION_RE.search(result)
                 if version:
                     return version.group(0)
             else:
                 # macOS/Linux approach
-                for cmd in ['google-chrome --version', 'chromium-browser --version', 'google-chrome-stable --version']:
+                for name in _CHROME_BINARIES:
+                    binary = shutil.which(name)
+                    if not binary:
+                        continue
+                    stat = os.stat(binary)
+                    key = (binary, stat.st_mtime_ns, stat.st_size)
+                    if key in _chrome_version_cache:
+                        return _chrome_version_cache[key]
                     try:
-                        result = subprocess.check_output(cmd, shell=True, text=True, stderr=subprocess.PIPE)
-                        version = re.search(r'\d+\.\d+\.\d+\.\d+', result)
+                        result = subprocess.check_output(
+                            [binary, '--version'], text=True, stderr=subprocess.PIPE
+                        )
+                        version = _VERSION_RE.search(result)
                         if version:
+                            _chrome_version_cache[key] = version.group(0)
                             return version.group(0)
                     except subprocess.CalledProcessError:
                         continue
@@ -74,7 +133,7 @@ class ChromeDriverManager:
             
         # Fallback to latest stable ChromeDriver version
         try:
-            response = requests.get(self.CHROME_VERSION_URL, timeout=10)
+            response = _get_session().get(self.CHROME_VERSION_URL, timeout=10)
             response.raise_for_status()
             return response.text.strip()
         except Exception as e:
@@ -93,7 +152,7 @@ class ChromeDriverManager:
                 
             # For older versions, try to get the matching version
             version_url = f"{self.CHROME_VERSION_URL}_{self.chrome_version}"
-            response = requests.get(version_url, timeout=10)
+            response = _get_session().get(version_url, timeout=10)
             response.raise_for_status()
             return response.text.strip()
             
@@ -140,54 +199,34 @@ class ChromeDriverManager:
     
     def download_driver(self, url: str, target_path: Path) -> None:
         """Download and extract ChromeDriver."""
-        zip_path = target_path.with_suffix('.zip')
-        temp_dir = target_path.parent / 'temp_extract'
-        
         try:
-            # Create temp directory for extraction
-            temp_dir.mkdir(parents=True, exist_ok=True)
+            target_path.parent.mkdir(parents=True, exist_ok=True)
             
             # Download the file
             self.logger.info(f"Downloading ChromeDriver from {url}")
-            response = requests.get(url, stream=True, timeout=30)
+            response = _get_session().get(url, stream=True, timeout=30)
             response.raise_for_status()
             
-            # Save the zip file
-            with open(zip_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-            
-            # Extract the zip file
-            self.logger.info(f"Extracting ChromeDriver to {temp_dir}")
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(temp_dir)
-            
-            # Find the chromedriver executable in the extracted files
-            driver_executable = None
-            for root, _, files in os.walk(temp_dir):
-                for file in files:
-                    if file.lower() in ('chromedriver', 'chromedriver.exe'):
-                        driver_executable = Path(root) / file
-                        break
-                if driver_executable:
-                    break
+            # Keep the archive in memory; only the extracted driver is
+            # written to disk
+            archive = io.BytesIO()
+            for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                archive.write(chunk)
             
-            if not driver_executable or not driver_executable.exists():
-                raise RuntimeError("Could not find chromedriver executable in the downloaded package")
-            
-            # Move to target location
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-            if driver_executable != target_path:
-                if target_path.exists():
-                    target_path.unlink()
-                driver_executable.rename(target_path)
-            
-            # Clean up
-            if temp_dir.exists():
-                import shutil
-                shutil.rmtree(temp_dir)
-            if zip_path.exists():
-                zip_path.unlink()
+            # Extract only the chromedriver executable, located via the
+            # archive's central directory rather than unpacking everything
+            self.logger.info(f"Extracting ChromeDriver to {target_path}")
+            with zipfile.ZipFile(archive, 'r') as zip_ref:
+                member = next(
+                    (name for name in zip_ref.namelist()
+                     if name.rsplit('/', 1)[-1].lower() in ('chromedriver', 'chromedriver.exe')),
+                    None
+                )
+                if member is None:
+                    raise RuntimeError("Could not find chromedriver executable in the downloaded package")
+                
+                with zip_ref.open(member) as src, open(target_path, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, _DOWNLOAD_CHUNK_SIZE)
             
             # Make the driver executable (Unix-like systems)
             if platform.system() != 'Windows':
@@ -199,11 +238,6 @@ class ChromeDriverManager:
             # Clean up on error
             if target_path.exists():
                 target_path.unlink()
-            if temp_dir.exists():
-                import shutil
-                shutil.rmtree(temp_dir, ignore_errors=True)
-            if zip_path.exists():
-                zip_path.unlink()
                 
             self.logger.error(f"Failed to download ChromeDriver: {str(e)}")
             raise RuntimeError(f"Failed to download ChromeDriver: {e}")
@@ -215,6 +249,15 @@ class ChromeDriverManager:
             if target_dir is None:
                 target_dir = Path.home() / ".chromedriver"
             
+            # Reuse the driver resolved for this Chrome version by an earlier
+            # run; a Chrome upgrade changes the key
+            cache_file = target_dir / _RESOLVED_CACHE_FILE
+            resolved = self._read_resolved_cache(cache_file)
+            cached_path = resolved.get(self.chrome_version)
+            if cached_path and Path(cached_path).exists():
+                self.logger.debug(f"Using cached ChromeDriver at {cached_path}")
+                return Path(cached_path)
+            
             # Create target directory if it doesn't exist
             version = self.get_matching_chromedriver_version()
             version_dir = target_dir / version
@@ -228,28 +271,46 @@ class ChromeDriverManager:
             # Return if driver already exists and is executable
             if driver_path.exists():
                 self.logger.debug(f"Using existing ChromeDriver at {driver_path}")
-                return driver_path
-            
-            # Download and extract ChromeDriver
-            self.logger.info(f"Downloading ChromeDriver {version} for {self.platform}")
-            driver_url = self.get_driver_url(version)
-            self.download_driver(driver_url, driver_path)
-            
-            # Verify the driver was downloaded and is executable
-            if not driver_path.exists():
-                raise RuntimeError(f"Failed to locate ChromeDriver at {driver_path} after download")
-                
-            # Make the driver executable (Unix-like systems)
-            if not is_windows:
-                driver_path.chmod(0o755)
+            else:
+                # Download and extract ChromeDriver
+                self.logger.info(f"Downloading ChromeDriver {version} for {self.platform}")
+                driver_url = self.get_driver_url(version)
+                self.download_driver(driver_url, driver_path)
                 
-            self.logger.info(f"Successfully set up ChromeDriver at {driver_path}")
+                # Verify the driver was downloaded (download_driver sets the executable bit)
+                if not driver_path.exists():
+                    raise RuntimeError(f"Failed to locate ChromeDriver at {driver_path} after download")
+                    
+                self.logger.info(f"Successfully set up ChromeDriver at {driver_path}")
+            
+            resolved[self.chrome_version] = str(driver_path)
+            self._write_resolved_cache(cache_file, resolved)
             return driver_path
             
         except Exception as e:
             self.logger.error(f"Failed to set up ChromeDriver: {e}")
             raise
-        return driver_path
+
+    def _read_resolved_cache(self, cache_file: Path) -> Dict[str, str]:
+        """Load the Chrome version -> driver path map, or an empty one."""
+        try:
+            data = json.loads(cache_file.read_bytes())
+            return data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.debug(f"Ignoring unreadable driver cache {cache_file}: {e}")
+            return {}
+    
+    def _write_resolved_cache(self, cache_file: Path, resolved: Dict[str, str]) -> None:
+        """Persist the Chrome version -> driver path map; failures are not fatal."""
+        try:
+            # Write then rename so concurrent readers never see a partial file
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            tmp_file.write_text(json.dumps(resolved, indent=2), encoding='utf-8')
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            self.logger.debug(f"Could not write driver cache {cache_file}: {e}")
 
 def ensure_chromedriver_available() -> str:
     """
@@ -259,8 +320,22 @@ def ensure_chromedriver_available() -> str:
         str: Path to the ChromeDriver executable
     """
     try:
-        manager = ChromeDriverManager()
-        driver_path = manager.setup_chromedriver()
-        return str(driver_path)
+        driver_path = _setup_chromedriver_once()
+        # Re-run setup if the cached driver was removed since
+        if not Path(driver_path).exists():
+            _setup_chromedriver_once.cache_clear()
+            driver_path = _setup_chromedriver_once()
+        return driver_path
     except Exception as e:
         raise RuntimeError(f"Failed to set up ChromeDriver: {e}")
+
+
+@lru_cache(maxsize=1)
+def _setup_chromedriver_once() -> str:
+    """Resolve the ChromeDriver path once per process.
+    
+    Building a ChromeDriverManager detects the Chrome version and may query
+    the network, so later calls reuse the first successful result. Failures
+    are not cached.
+    """
+    return str(ChromeDriverManager().setup_chromedriver())
@@ -4,23 +4,35 @@ Utility functions for Chrome Puppet.
 This module provides various utility functions for file operations, logging,
 and system information that are used throughout the Chrome Puppet project.
 """
+import atexit
 import os
-import sys
 import logging
+import logging.handlers
 import platform
+import queue
+import random
 import datetime
 import shutil
+import threading
+import time
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple, Union, Callable
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[logging.StreamHandler(sys.stdout)]
-)
 logger = logging.getLogger(__name__)
 
+# Serializes setup_logger so concurrent callers don't interleave handler changes
+_setup_lock = threading.Lock()
+
+# Shared by every handler setup_logger creates; formatters are stateless
+_LOG_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+# Background writers for setup_logger's log files, keyed by logger name;
+# stopped (and so flushed) at exit
+_log_listeners: Dict[str, logging.handlers.QueueListener] = {}
+
+# Chrome executable found by the last is_chrome_installed() call
+_chrome_path: Optional[str] = None
+
 def get_default_download_dir() -> str:
     """Get the default download directory based on the operating system."""
     home = os.path.expanduser("~")
@@ -47,6 +59,12 @@ def ensure_dir(directory: Union[str, Path]) -> str:
 
 def is_chrome_installed() -> Tuple[bool, Optional[str]]:
     """Check if Chrome is installed and return its path."""
+    global _chrome_path
+    
+    # Re-check only the previously found path before probing every location
+    if _chrome_path and os.path.isfile(_chrome_path):
+        return True, _chrome_path
+    
     system = platform.system().lower()
     
     if system == "windows":
@@ -67,6 +85,7 @@ def is_chrome_installed() -> Tuple[bool, Optional[str]]:
     
     for path in paths:
         if os.path.isfile(path):
+            _chrome_path = path
             return True, path
     
     return False, None
@@ -83,6 +102,21 @@ def get_chrome_version() -> Optional[str]:
         logger.warning(f"Could not determine Chrome version: {e}", exc_info=True)
         return None
 
+def _stop_log_listener(name: str) -> None:
+    """Flush and stop the background writer of a logger, if it has one."""
+    listener = _log_listeners.pop(name, None)
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+@atexit.register
+def _stop_log_listeners() -> None:
+    """Flush every pending log record to disk before the interpreter exits."""
+    with _setup_lock:
+        for name in list(_log_listeners):
+            _stop_log_listener(name)
+
 def setup_logger(
     name: str,
     log_level: int = logging.INFO,
@@ -100,54 +134,71 @@ def setup_logger(
     Returns:
         Configured logger instance
     """
-    logger = logging.getLogger(name)
-    logger.setLevel(log_level)
-    
-    # Clear existing handlers if any
-    logger.handlers = []
-    
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
+    settings = (log_level, str(log_file) if log_file else None, console)
     
-    # Add file handler if log_file is provided
-    if log_file:
-        ensure_dir(os.path.dirname(log_file) if os.path.dirname(log_file) else None)
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(log_level)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-    
-    # Add console handler if console is True
-    if console:
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(log_level)
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
-    
-    return logger
+    with _setup_lock:
+        logger = logging.getLogger(name)
+        
+        # Repeated calls with the same settings keep the existing handlers
+        if getattr(logger, '_setup_settings', None) == settings:
+            return logger
+        
+        logger.setLevel(log_level)
+        
+        # Close and clear existing handlers if any
+        _stop_log_listener(name)
+        for handler in logger.handlers:
+            handler.close()
+        logger.handlers = []
+        
+        # Add file handler if log_file is provided; the file is only opened
+        # when the first record is written. Records reach it through a queue
+        # so logging calls never wait on disk I/O
+        if log_file:
+            if os.path.dirname(log_file):
+                ensure_dir(os.path.dirname(log_file))
+            file_handler = logging.FileHandler(log_file, encoding='utf-8', delay=True)
+            file_handler.setLevel(log_level)
+            file_handler.setFormatter(_LOG_FORMATTER)
+            log_queue: queue.Queue = queue.Queue(-1)
+            listener = logging.handlers.QueueListener(log_queue, file_handler)
+            listener.start()
+            _log_listeners[name] = listener
+            logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        
+        # Add console handler if console is True
+        if console:
+            console_handler = logging.StreamHandler()
+            console_handler.setLevel(log_level)
+            console_handler.setFormatter(_LOG_FORMATTER)
+            logger.addHandler(console_handler)
+        
+        logger._setup_settings = settings
+        return logger
 
 def retry(
     func: Callable,
     max_attempts: int = 3,
     delay: float = 1.0,
     exceptions: tuple = (Exception,),
-    logger: Optional[logging.Logger] = None
+    logger: Optional[logging.Logger] = None,
+    backoff: float = 2.0,
+    max_delay: float = 16.0
 ):
     """Retry decorator for functions that may fail.
     
     Args:
         func: Function to retry
         max_attempts: Maximum number of attempts (default: 3)
-        delay: Delay between attempts in seconds (default: 1.0)
+        delay: Delay before the first retry in seconds (default: 1.0)
         exceptions: Tuple of exceptions to catch (default: Exception)
         logger: Logger instance for logging retries (optional)
+        backoff: Multiplier applied to the delay after each failure (default: 2.0)
+        max_delay: Upper bound for a single delay in seconds (default: 16.0)
         
     Returns:
         Wrapped function with retry logic
     """
-    import time
-    
     def wrapper(*args, **kwargs):
         last_exception = None
         for attempt in range(1, max_attempts + 1):
@@ -160,7 +211,9 @@ def retry(
                         f"Attempt {attempt}/{max_attempts} failed: {e}"
                     )
                 if attempt < max_attempts:
-                    time.sleep(delay)
+                    # Exponential backoff with a little jitter to avoid lockstep retries
+                    wait = min(delay * backoff ** (attempt - 1), max_delay)
+                    time.sleep(wait + random.uniform(0, 0.5))
         raise last_exception
     
     return wrapper